@@ -0,0 +1,123 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from core.replay import SyntheticDataProvider, ReplayDataProvider
+from core.candle_store import CandleStore
+from core.signal_engine import RSIIndicator, MACDIndicator, OBVIndicator, DynamicSignalGenerator
+from core.data import get_default_config
+from utils.render import render_signal_card, card_images
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+WINDOWS = [("7d", "1m"), ("30d", "5m"), ("30d", "1h"), ("6mo", "1d"), ("1y", "1d")]
+INDICATOR_SETS = {
+    "rsi": lambda: [RSIIndicator(period=14, buy_threshold=30, sell_threshold=70)],
+    "macd": lambda: [MACDIndicator(fast=12, slow=26, signal=9)],
+    "obv": lambda: [OBVIndicator()],
+    "combined": lambda: [RSIIndicator(period=14, buy_threshold=30, sell_threshold=70), MACDIndicator(fast=12, slow=26, signal=9), OBVIndicator()]
+}
+
+# Regressions smaller than these absolute amounts are noise, whatever the relative change.
+FLOORS = {"wall_ms": 2, "alloc_peak_mb": 2, "rss_peak_mb": 10}
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+def run_pipeline(provider, indicator_set: str, period: str, interval: str, live: bool) -> dict:
+    config = get_default_config("crypto")
+    start = time.perf_counter()
+    data = provider.fetch_data("BTC/USDT", period, interval, "crypto")
+    fetched = time.perf_counter()
+    indicators = INDICATOR_SETS[indicator_set]()
+    latest = DynamicSignalGenerator(config, live=live).generate_signals(data, indicators, "BTC/USDT", "crypto").iloc[-1]
+    computed = time.perf_counter()
+    card_images.clear()
+    render_signal_card(f"Signal Report\nTicker: BTC/USDT\nInterval: {interval}\n" + "\n".join(f"{name}: {value}" for name, value in latest.items()))
+    rendered = time.perf_counter()
+    return {"fetch_ms": (fetched - start) * 1000, "signals_ms": (computed - fetched) * 1000, "render_ms": (rendered - computed) * 1000, "wall_ms": (rendered - start) * 1000}
+
+def measure(provider, indicator_set: str, period: str, interval: str, live: bool, repeat: int) -> dict:
+    run_pipeline(provider, indicator_set, period, interval, live)
+    # Best-of-N is far less sensitive to scheduler noise than the mean on a shared instance.
+    runs = [run_pipeline(provider, indicator_set, period, interval, live) for _ in range(repeat)]
+    tracemalloc.start()
+    run_pipeline(provider, indicator_set, period, interval, live)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        **{stage: min(run[stage] for run in runs) for stage in runs[0]},
+        "alloc_peak_mb": peak / (1024 * 1024),
+        "rss_peak_mb": peak_rss_mb()
+    }
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for case, metrics in results.items():
+        reference = baseline.get(case)
+        if reference is None:
+            continue
+        for metric, floor in FLOORS.items():
+            if metric not in reference:
+                continue
+            if metrics[metric] > reference[metric] * (1 + tolerance) and metrics[metric] - reference[metric] > floor:
+                regressions.append(f"{case} {metric}: {reference[metric]:.2f} -> {metrics[metric]:.2f}")
+    return regressions
+
+def make_provider(replay: str = None):
+    return ReplayDataProvider(CandleStore(replay)) if replay else SyntheticDataProvider(seed=1, now_ms=1_750_000_000_000)
+
+def measure_isolated(case: str, replay: str, repeat: int) -> dict:
+    # ru_maxrss is a process-lifetime peak, so each case runs in a fresh interpreter to get its own peak RSS.
+    command = [sys.executable, os.path.abspath(__file__), "--case", case, "--repeat", str(repeat)]
+    if replay:
+        command += ["--replay", replay]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{case} failed:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time fetch -> generate_signals -> render on offline data.")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative slowdown before a case counts as a regression")
+    parser.add_argument("--replay", help="CandleStore directory to replay instead of synthetic data")
+    parser.add_argument("--baseline", help="baseline file (defaults to benchmarks/baseline.json, or baseline.json inside the --replay directory)")
+    parser.add_argument("--update", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        indicator_set, period, interval, mode = args.case.split("/")
+        print(json.dumps(measure(make_provider(args.replay), indicator_set, period, interval, mode == "live", args.repeat)))
+        return 0
+
+    baseline = args.baseline or (os.path.join(args.replay, "baseline.json") if args.replay else BASELINE)
+    results = {}
+    for period, interval in WINDOWS:
+        for indicator_set in INDICATOR_SETS:
+            for live in (True, False):
+                case = f"{indicator_set}/{period}/{interval}/{'live' if live else 'full'}"
+                results[case] = measure_isolated(case, args.replay, args.repeat)
+                metrics = results[case]
+                print(f"{case:<28} {metrics['wall_ms']:>8.2f} ms (fetch {metrics['fetch_ms']:.2f}, signals {metrics['signals_ms']:.2f}, render {metrics['render_ms']:.2f}) {metrics['alloc_peak_mb']:>8.2f} MiB alloc {metrics['rss_peak_mb']:>8.1f} MiB rss")
+
+    if args.update or not os.path.exists(baseline):
+        with open(baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {baseline}")
+        return 0
+    with open(baseline) as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
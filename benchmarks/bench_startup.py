@@ -0,0 +1,64 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+# None of these may load before the bot is answering; they are pulled in lazily or by the background preload.
+DEFERRED = ("pandas", "numpy", "ccxt", "yfinance", "PIL", "matplotlib")
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return modules
+
+def measure(module: str) -> Dict:
+    env = dict(os.environ)
+    # Importing run builds the Application, which only checks the token's shape.
+    env.setdefault("TG_BOT_TOKEN", "123456:startup-benchmark")
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=ROOT, env=env, capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    modules = parse_importtime(result.stderr)
+    top = next(cumulative for name, depth, _, cumulative in modules if name == module and depth == 0)
+    return {"import_ms": top / 1000, "wall_ms": wall_ms, "modules": modules}
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure cold-start import time of the bot with python -X importtime.")
+    parser.add_argument("--module", default="run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("STARTUP_BUDGET_MS", 2500)), help="fail when the best import time exceeds this")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest imports to list")
+    args = parser.parse_args()
+
+    # The first run compiles bytecode; every measured run then starts from a warm .pyc cache like a deploy does.
+    measure(args.module)
+    runs = [measure(args.module) for _ in range(args.repeat)]
+    best = min(runs, key=lambda run: run["import_ms"])
+
+    print(f"import {args.module}: {best['import_ms']:.1f} ms (process wall {min(run['wall_ms'] for run in runs):.1f} ms, best of {args.repeat})")
+    for name, depth, self_us, cumulative_us in sorted(best["modules"], key=lambda m: m[2], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:>8.1f} ms self {cumulative_us / 1000:>8.1f} ms cumulative  {name}")
+
+    failures = []
+    loaded = {name.split(".")[0] for name, _, _, _ in best["modules"]}
+    for name in DEFERRED:
+        if name in loaded:
+            failures.append(f"{name} is imported at startup")
+    if best["import_ms"] > args.budget_ms:
+        failures.append(f"import {args.module} took {best['import_ms']:.1f} ms, budget {args.budget_ms:.0f} ms")
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
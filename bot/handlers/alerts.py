@@ -0,0 +1,122 @@
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from telegram import Update
+from telegram.ext import ContextTypes
+from core.alerts import SubscriptionRegistry, SendQueue, AlertEngine, SubscriptionKey
+from core.prewarm import PrewarmScheduler
+from core.metrics import registry, send_seconds
+from core.executor import run_io
+from core.data import get_default_config, validate_period_interval
+from core.config import alerts_file, alert_global_rate, alert_chat_interval, alert_max_per_chat, cache_max_age, prewarm_concurrency, prewarm_jitter
+from bot.handlers.analysis import get_signal_report
+from keyboards import ticker_map
+from typing import Dict, Optional, Tuple
+
+subscriptions = SubscriptionRegistry(alerts_file)
+registry.register_stats("alerts", lambda: {'groups': len(subscriptions.groups())})
+signal_types = ["combined", "rsi", "macd", "obv"]
+
+def pick_period(asset_type: str, interval: str) -> Optional[str]:
+    default = get_default_config(asset_type)[asset_type]['period']
+    for period in [default, "30d", "14d", "7d", "6mo", "1y"]:
+        if validate_period_interval(period, interval):
+            return period
+    return None
+
+def format_alert(key: SubscriptionKey, report: Dict, previous: Tuple[str, float]) -> str:
+    symbol, asset_type, interval, period, signal_type = key
+    entry_text = f"${report['entry_point']:.2f}" if report['entry_point'] is not None else "N/A"
+    return (
+        f"🔔 {symbol} {interval} ({signal_type})\n"
+        f"Direction: {previous[0]} → {report['direction']}\n"
+        f"Confidence: {previous[1]:.1f}% → {report['confidence']:.1f}%\n"
+        f"Entry Point: {entry_text}"
+    )
+
+def build_alerts(bot) -> Tuple[SendQueue, PrewarmScheduler]:
+    async def send(chat_id: int, text: str) -> None:
+        with send_seconds.time(method="alert"):
+            await bot.send_message(chat_id=chat_id, text=text)
+
+    queue = SendQueue(send, alert_global_rate, alert_chat_interval)
+    # Each close goes through get_signal_report: live mode only scores the warmup plus tail bars, and the
+    # report lands in the shared signal cache, so the same key tapped in the menu costs nothing extra.
+    engine = AlertEngine(
+        subscriptions,
+        evaluate=lambda key: get_signal_report(key[0], key[1], key[3], key[2], key[4]),
+        queue=queue,
+        format_alert=format_alert
+    )
+    scheduler = PrewarmScheduler(
+        subscriptions.groups,
+        refresh=engine.evaluate_group,
+        interval_of=lambda key: key[2],
+        concurrency=prewarm_concurrency,
+        jitter=prewarm_jitter,
+        max_age=cache_max_age
+    )
+    return queue, scheduler
+
+async def subscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    args = context.args
+    usage = (
+        f"Usage: /subscribe <{'|'.join(ticker_map)}> SYMBOL [interval] [{'|'.join(signal_types)}] [min_confidence]"
+    )
+    if len(args) < 2 or args[0] not in ticker_map:
+        await update.message.reply_text(usage)
+        return
+    asset_type = args[0]
+    symbol = args[1].upper()
+    if asset_type == 'crypto':
+        symbol = symbol.replace('-', '/')
+    interval = args[2] if len(args) > 2 else get_default_config(asset_type)[asset_type]['interval']
+    signal_type = args[3].lower() if len(args) > 3 else "combined"
+    period = pick_period(asset_type, interval)
+    if period is None or signal_type not in signal_types:
+        await update.message.reply_text(usage)
+        return
+    try:
+        threshold = float(args[4]) if len(args) > 4 else None
+    except ValueError:
+        await update.message.reply_text(usage)
+        return
+
+    chat_id = update.effective_chat.id
+    key = (symbol, asset_type, interval, period, signal_type)
+    existing = [entry_key for entry_key, _ in subscriptions.for_chat(chat_id)]
+    if key not in existing and len(existing) >= alert_max_per_chat:
+        await update.message.reply_text(f"❌ You already have {len(existing)} subscriptions, the limit is {alert_max_per_chat}. Use /unsubscribe first.")
+        return
+    # Evaluate once up front so a typo'd symbol is rejected here instead of failing at every candle close.
+    try:
+        report = await get_signal_report(symbol, asset_type, period, interval, signal_type)
+    except Exception as e:
+        report = {'error': str(e) or type(e).__name__}
+    if 'error' in report:
+        await update.message.reply_text(f"❌ Can't subscribe to {symbol} {interval}: {report['error']}")
+        return
+
+    await run_io(subscriptions.subscribe, chat_id, key, threshold)
+    threshold_text = f", or when confidence reaches {threshold:.0f}%" if threshold is not None else ""
+    await update.message.reply_text(
+        f"🔔 Subscribed to {symbol} {interval} ({signal_type}). You'll be alerted when the signal flips{threshold_text}."
+    )
+
+async def unsubscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    symbol = context.args[0].upper() if context.args else None
+    removed = await run_io(subscriptions.unsubscribe, update.effective_chat.id, symbol)
+    if symbol is not None and '-' in symbol:
+        removed += await run_io(subscriptions.unsubscribe, update.effective_chat.id, symbol.replace('-', '/'))
+    await update.message.reply_text(f"🔕 Removed {removed} subscription(s).")
+
+async def subscriptions_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    entries = subscriptions.for_chat(update.effective_chat.id)
+    if not entries:
+        await update.message.reply_text("You have no subscriptions. Use /subscribe to add one.")
+        return
+    lines = []
+    for (symbol, asset_type, interval, period, signal_type), threshold in entries:
+        threshold_text = f", ≥{threshold:.0f}%" if threshold is not None else ""
+        lines.append(f"• {symbol} ({asset_type}) {interval}/{period} {signal_type}{threshold_text}")
+    await update.message.reply_text("🔔 Your subscriptions:\n" + "\n".join(lines))
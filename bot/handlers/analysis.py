@@ -1,13 +1,125 @@
+import asyncio
 import os
 import sys
+import time
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from telegram import Update
 from telegram.ext import ContextTypes
-from core.data import generate_rsi_signal, generate_macd_signal, generate_obv_signal, generate_combined_signal
-from core.signal_engine import YahooFinanceDataProvider, BinanceDataProvider, RSIIndicator, MACDIndicator, OBVIndicator, DynamicSignalGenerator
-from keyboards import get_back_keyboard, get_period_keyboard
-from PIL import Image, ImageDraw, ImageFont
-from io import BytesIO
+from telegram.error import BadRequest
+from core.data import get_data_provider, get_default_config, validate_period_interval
+from core.signal_engine import RSIIndicator, MACDIndicator, OBVIndicator, DynamicSignalGenerator
+from core.executor import run_io, run_cpu
+from core.coalesce import RequestCoalescer
+from core.cache import OHLCVCache, next_candle_close
+from core.prewarm import PrewarmScheduler
+from core.metrics import registry, send_seconds, request_seconds, requests_in_flight
+from core.config import fetch_timeout, compute_timeout, cache_max_mb, cache_max_age, prewarm_hot_set, prewarm_concurrency, prewarm_jitter
+from keyboards import get_back_keyboard, get_period_keyboard, ticker_map
+from utils.render import render_signal_card, cached_file_id, remember_file_id, card_file_ids
+from utils.profiling import profiler
+from typing import Dict, List, Tuple
+
+signal_coalescer = RequestCoalescer()
+signal_results = OHLCVCache(max_bytes=cache_max_mb * 1024 * 1024, max_age=cache_max_age)
+registry.register_stats("cache", signal_results.stats, cache="signal")
+registry.register_stats("coalescer", signal_coalescer.stats)
+
+SIGNAL_LABELS = {"rsi": "RSI", "macd": "MACD", "obv": "OBV", "combined": "combined"}
+
+def build_signal_report(symbol: str, asset_type: str, period: str, interval: str, signal_type: str) -> Dict:
+    try:
+        config = get_default_config(asset_type)
+        if not validate_period_interval(period, interval):
+            raise ValueError(f"Invalid period ({period}) for interval ({interval})")
+        provider, provider_symbol = get_data_provider(asset_type, symbol)
+        market_data = provider.fetch_data(provider_symbol, period, interval, asset_type)
+
+        kind = signal_type if signal_type in ("rsi", "macd", "obv") else "combined"
+        indicators = []
+        if kind in ("rsi", "combined"):
+            indicators.append(RSIIndicator(period=14, buy_threshold=config[asset_type]['rsi_buy'], sell_threshold=config[asset_type]['rsi_sell']))
+        if kind in ("macd", "combined"):
+            indicators.append(MACDIndicator(fast=12, slow=26, signal=9))
+        if kind in ("obv", "combined"):
+            indicators.append(OBVIndicator())
+        df = DynamicSignalGenerator(config, live=True).generate_signals(market_data, indicators, provider_symbol, asset_type)
+    except Exception as e:
+        return {'error': f"Error generating {SIGNAL_LABELS.get(signal_type, signal_type)} signal for {symbol} ({asset_type}): {str(e)}"}
+
+    latest_signal = df.iloc[-1]
+    return {
+        'direction': "Buy" if latest_signal['Signal'] == 1 else "Sell" if latest_signal['Signal'] == -1 else "Hold",
+        'entry_point': latest_signal['Close'] if latest_signal['Signal'] != 0 else None,
+        'exit_point': latest_signal['Exit_Price'] if latest_signal['Signal'] != 0 else None,
+        'confidence': min(latest_signal['Confidence'] * 100, 100)
+    }
+
+async def compute_signal_report(symbol: str, asset_type: str, period: str, interval: str, signal_type: str) -> Dict:
+    provider, provider_symbol = get_data_provider(asset_type, symbol)
+    session = profiler.sample()
+    if session is None:
+        await run_io(provider.fetch_data, provider_symbol, period, interval, asset_type, timeout=fetch_timeout)
+        return await run_cpu(build_signal_report, symbol, asset_type, period, interval, signal_type, timeout=compute_timeout)
+    # cProfile only sees its own thread, so the profile runs inside each worker call.
+    try:
+        await run_io(session.call, provider.fetch_data, provider_symbol, period, interval, asset_type, timeout=fetch_timeout)
+        report = await run_cpu(session.call, build_signal_report, symbol, asset_type, period, interval, signal_type, timeout=compute_timeout)
+        await run_io(profiler.save, session, (symbol, interval, period, signal_type))
+    finally:
+        session.close()
+    return report
+
+async def get_signal_report(symbol: str, asset_type: str, period: str, interval: str, signal_type: str, refresh: bool = False) -> Dict:
+    key = (symbol, asset_type, interval, period, signal_type)
+    report = None if refresh else signal_results.get(key)
+    if report is None:
+        report = await signal_coalescer.run(key, lambda: compute_signal_report(symbol, asset_type, period, interval, signal_type))
+        if 'error' not in report:
+            signal_results.put(key, report, next_candle_close(interval))
+    return report
+
+def hot_set() -> List[Tuple[str, str, str, str, str]]:
+    if prewarm_hot_set:
+        keys = []
+        for entry in prewarm_hot_set.split(','):
+            parts = entry.strip().split(':')
+            if len(parts) == 4:
+                parts.append("combined")
+            if len(parts) != 5 or parts[0] not in ticker_map or not parts[1] or not validate_period_interval(parts[3], parts[2]) or parts[4] not in SIGNAL_LABELS:
+                print(f"Skipping PREWARM_HOT_SET entry {entry.strip()!r}: expected asset_type:SYMBOL:interval:period[:type]")
+                continue
+            asset_type, symbol, interval, period, signal_type = parts
+            keys.append((symbol, asset_type, interval, period, signal_type))
+        return keys
+    keys = []
+    for asset_type, tickers in ticker_map.items():
+        defaults = get_default_config(asset_type)[asset_type]
+        keys.extend((symbol, asset_type, defaults['interval'], defaults['period'], "combined") for symbol in tickers.values())
+    return keys
+
+def build_prewarm_scheduler() -> PrewarmScheduler:
+    return PrewarmScheduler(
+        hot_set(),
+        refresh=lambda key: get_signal_report(key[0], key[1], key[3], key[2], key[4], refresh=True),
+        interval_of=lambda key: key[2],
+        concurrency=prewarm_concurrency,
+        jitter=prewarm_jitter,
+        max_age=cache_max_age
+    )
+
+async def send_signal_card(message, text: str) -> None:
+    file_id = cached_file_id(text)
+    if file_id is not None:
+        try:
+            with send_seconds.time(method="file_id"):
+                await message.reply_photo(photo=file_id, caption="📊 Signal Generated")
+            return
+        except BadRequest:
+            card_file_ids.invalidate(text)
+    image = await run_cpu(render_signal_card, text, timeout=compute_timeout)
+    with send_seconds.time(method="upload"):
+        sent = await message.reply_photo(photo=image, caption="📊 Signal Generated")
+    remember_file_id(text, sent)
 
 async def signal_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
@@ -19,14 +131,6 @@ async def signal_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     interval = context.user_data.get("interval")
     signal_type = context.user_data.get("signal_type", "combined")
 
-    ticker_map = {
-        "commodities": {"commodity_gold": "GC=F", "commodity_silver": "SI=F", "commodity_oil": "CL=F", "commodity_natgas": "NG=F"},
-        "crypto": {"crypto_btc_usd": "BTC/USDT", "crypto_eth_usd": "ETH/USDT", "crypto_sol_usd": "SOL/USDT", "crypto_bnb_usd": "BNB/USDT", "crypto_ada_usd": "ADA/USDT"},
-        "forex": {"forex_eur_usd": "EURUSD=X", "forex_gbp_usd": "GBPUSD=X", "forex_usd_jpy": "USDJPY=X", "forex_aud_usd": "AUDUSD=X", "forex_usd_chf": "USDCHF=X"},
-        "indices": {"index_sp500": "^GSPC", "index_nasdaq": "^IXIC", "index_dowj": "^DJI", "index_ftse": "^FTSE", "index_nikkei": "^N225"},
-        "stocks": {"stock_aapl": "AAPL", "stock_tsla": "TSLA", "stock_goog": "GOOG", "stock_msft": "MSFT", "stock_amzn": "AMZN"}
-    }
-
     if query.data == "generate_signal":
         if not all([ticker, asset_type, period, interval]):
             await query.edit_message_text(
@@ -43,82 +147,50 @@ async def signal_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             )
             return
 
+        outcome = "ok"
+        started = time.perf_counter()
+        requests_in_flight.inc()
         try:
-            if signal_type == "rsi":
-                signal_data = generate_rsi_signal(symbol, asset_type, period, interval)
-            elif signal_type == "macd":
-                signal_data = generate_macd_signal(symbol, asset_type, period, interval)
-            elif signal_type == "obv":
-                signal_data = generate_obv_signal(symbol, asset_type, period, interval)
-            else:
-                signal_data = generate_combined_signal(symbol, asset_type, period, interval)
-
-            if 'error' in signal_data:
+            report = await get_signal_report(symbol, asset_type, period, interval, signal_type)
+
+            if 'error' in report:
+                outcome = "error"
                 await query.edit_message_text(
-                    f"❌ Error generating signal: {signal_data['error']}",
+                    f"❌ Error generating signal: {report['error']}",
                     reply_markup=get_back_keyboard()
                 )
                 return
 
-            provider = BinanceDataProvider() if asset_type == 'crypto' else YahooFinanceDataProvider()
-            market_data = provider.fetch_data(symbol, period, interval, asset_type)
-            df = market_data.df.copy()
-
-            config = {
-                asset_type: {'rsi_buy': 30 if asset_type in ['crypto', 'forex'] else 40 if asset_type in ['stocks', 'indices'] else 35,
-                             'rsi_sell': 70 if asset_type in ['crypto', 'forex'] else 60 if asset_type in ['stocks', 'indices'] else 65}
-            }
-            indicators = []
-            if signal_type == "rsi" or signal_type == "combined":
-                indicators.append(RSIIndicator(period=14, buy_threshold=config[asset_type]['rsi_buy'], sell_threshold=config[asset_type]['rsi_sell']))
-            if signal_type == "macd" or signal_type == "combined":
-                indicators.append(MACDIndicator(fast=12, slow=26, signal=9))
-            if signal_type == "obv" or signal_type == "combined":
-                indicators.append(OBVIndicator())
-            signal_generator = DynamicSignalGenerator(config)
-            df = signal_generator.generate_signals(market_data, indicators, symbol, asset_type)
-
-            latest_signal = df.iloc[-1]
-            direction = "Buy" if latest_signal['Signal'] == 1 else "Sell" if latest_signal['Signal'] == -1 else "Hold"
-            entry_point = latest_signal['Close'] if latest_signal['Signal'] != 0 else None
-            exit_point = latest_signal['Exit_Price'] if latest_signal['Signal'] != 0 else None
-            confidence = min(latest_signal['Confidence'] * 100, 100) 
-
-            img = Image.new('RGB', (400, 200), color=(0, 0, 0))
-            d = ImageDraw.Draw(img)
-            try:
-                font = ImageFont.load_default()
-            except:
-                font = ImageFont.load_default()
-            entry_text = f"${entry_point:.2f}" if entry_point is not None else "N/A"
-            exit_text = f"${exit_point:.2f}" if exit_point is not None else "N/A"
+            entry_text = f"${report['entry_point']:.2f}" if report['entry_point'] is not None else "N/A"
+            exit_text = f"${report['exit_point']:.2f}" if report['exit_point'] is not None else "N/A"
             text = (
                 f"Signal Report\n"
                 f"Ticker: {ticker}\n"
                 f"Asset Type: {asset_type}\n"
                 f"Period: {period}\n"
                 f"Interval: {interval}\n"
-                f"Direction: {direction}\n"
+                f"Direction: {report['direction']}\n"
                 f"Entry Point: {entry_text}\n"
                 f"Exit Point: {exit_text}\n"
-                f"Confidence: {confidence:.1f}%"
-            )
-            d.multiline_text((10, 10), text, fill=(255, 255, 255), font=font)
-            buf = BytesIO()
-            img.save(buf, format='PNG')
-            buf.seek(0)
-
-            await query.message.reply_photo(
-                photo=buf,
-                caption="📊 Signal Generated",
+                f"Confidence: {report['confidence']:.1f}%"
             )
+            await send_signal_card(query.message, text)
             await query.delete_message()
-            buf.close()
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            await query.edit_message_text(
+                "❌ Timed out generating signal, please try again.",
+                reply_markup=get_back_keyboard()
+            )
         except Exception as e:
+            outcome = "error"
             await query.edit_message_text(
                 f"❌ Error generating signal: {str(e)}",
                 reply_markup=get_back_keyboard()
             )
+        finally:
+            requests_in_flight.dec()
+            request_seconds.observe(time.perf_counter() - started, outcome=outcome)
     elif query.data == "back_button":
         context.user_data["state"] = "select_period"
         valid_periods = ["7d", "14d", "30d", "6mo", "1y"]
@@ -4,14 +4,19 @@ import os
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from keyboards import get_asset_type_keyboard, get_back_keyboard, get_main_keyboard
+from bot.lazy import load
 
 async def analysis_type_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     await query.answer()
 
     if query.data == "bulk_button":
+        context.user_data["state"] = "bulk_analysis"
+        bulk = await load("bot.handlers.bulk")
+        universe = bulk.default_universe()
+        await query.edit_message_text(f"🤖 Scanning {len(universe)} tickers...")
         await query.edit_message_text(
-            "🤖 This feature is not available", reply_markup=get_back_keyboard()
+            await bulk.run_bulk_scan(universe), reply_markup=get_back_keyboard(), parse_mode="HTML"
         )
     elif query.data == "single_button":
         context.user_data["state"] = "select_asset_type"
@@ -0,0 +1,46 @@
+import asyncio
+import html
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from telegram import Update
+from telegram.ext import ContextTypes
+from core.scanner import scan_universe
+from core.executor import run_io
+from core.config import scan_timeout
+from keyboards import ticker_map
+from typing import Dict, List, Optional, Tuple
+
+def default_universe() -> List[Tuple[str, str]]:
+    return [(symbol, asset_type) for asset_type, tickers in ticker_map.items() for symbol in tickers.values()]
+
+def format_scan(table, errors: Dict[str, str], limit: int = 25, failed_limit: int = 20) -> str:
+    lines = [f"{'Ticker':<10} {'Signal':<5} {'Conf':>6} {'Close':>12}"]
+    for row in table.head(limit).itertuples():
+        direction = "Buy" if row.Signal == 1 else "Sell" if row.Signal == -1 else "Hold"
+        lines.append(f"{row.Ticker:<10} {direction:<5} {row.Confidence * 100:>5.1f}% {row.Close:>12.4f}")
+    text = f"📊 Bulk Analysis ({len(table)} ranked by confidence)\n<pre>{html.escape(chr(10).join(lines))}</pre>"
+    if errors:
+        # Keep the reply under Telegram's 4096-character limit however many symbols failed.
+        failed = sorted(errors)
+        more = f" and {len(failed) - failed_limit} more" if len(failed) > failed_limit else ""
+        text += f"\n❌ Failed: {html.escape(', '.join(symbol[:24] for symbol in failed[:failed_limit]))}{more}"
+    return text
+
+async def run_bulk_scan(universe: List[Tuple[str, str]], period: Optional[str] = None, interval: Optional[str] = None) -> str:
+    try:
+        table, errors = await run_io(scan_universe, universe, period, interval, timeout=scan_timeout)
+    except asyncio.TimeoutError:
+        return "❌ Timed out running bulk analysis, please try again."
+    return format_scan(table, errors)
+
+async def scan_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    if len(context.args) < 2 or context.args[0] not in ticker_map:
+        await update.message.reply_text(
+            f"Usage: /scan <{'|'.join(ticker_map)}> SYMBOL [SYMBOL ...]"
+        )
+        return
+    asset_type = context.args[0]
+    universe = [(symbol.upper(), asset_type) for symbol in context.args[1:]]
+    await update.message.reply_text(f"🤖 Scanning {len(universe)} tickers...")
+    await update.message.reply_text(await run_bulk_scan(universe), parse_mode="HTML")
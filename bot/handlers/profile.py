@@ -0,0 +1,41 @@
+import html
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from telegram import Update
+from telegram.ext import ContextTypes
+from core.executor import run_io
+from core.config import owner_id
+from utils.profiling import profiler
+
+MAX_MESSAGE = 4000
+USAGE = "Usage: /profile [on RATE | off | top [MATCH] | clear]"
+
+async def profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    if update.effective_user is None or str(update.effective_user.id) != owner_id:
+        return
+    args = context.args or []
+    action = args[0].lower() if args else "top"
+
+    if action == "on":
+        try:
+            rate = float(args[1]) if len(args) > 1 else 0.1
+        except ValueError:
+            await update.message.reply_text(USAGE)
+            return
+        if not 0 < rate <= 1 or not profiler.directory:
+            await update.message.reply_text("❌ Rate must be in (0, 1] and PROFILE_DIR must be set.")
+            return
+        profiler.sample_rate = rate
+        await update.message.reply_text(f"🔬 Profiling {rate:.0%} of signal computations into {profiler.directory}.")
+    elif action == "off":
+        profiler.sample_rate = 0.0
+        await update.message.reply_text(f"🔬 Profiling off ({profiler.sampled} sampled since start).")
+    elif action == "clear":
+        removed = await run_io(profiler.clear)
+        await update.message.reply_text(f"🔬 Removed {removed} profiles.")
+    elif action == "top":
+        summary = await run_io(profiler.summary, args[1] if len(args) > 1 else None)
+        await update.message.reply_text(f"<pre>{html.escape(summary[:MAX_MESSAGE])}</pre>", parse_mode="HTML")
+    else:
+        await update.message.reply_text(USAGE)
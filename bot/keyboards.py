@@ -1,5 +1,13 @@
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
+ticker_map = {
+    "commodities": {"commodity_gold": "GC=F", "commodity_silver": "SI=F", "commodity_oil": "CL=F", "commodity_natgas": "NG=F"},
+    "crypto": {"crypto_btc_usd": "BTC/USDT", "crypto_eth_usd": "ETH/USDT", "crypto_sol_usd": "SOL/USDT", "crypto_bnb_usd": "BNB/USDT", "crypto_ada_usd": "ADA/USDT"},
+    "forex": {"forex_eur_usd": "EURUSD=X", "forex_gbp_usd": "GBPUSD=X", "forex_usd_jpy": "USDJPY=X", "forex_aud_usd": "AUDUSD=X", "forex_usd_chf": "USDCHF=X"},
+    "indices": {"index_sp500": "^GSPC", "index_nasdaq": "^IXIC", "index_dowj": "^DJI", "index_ftse": "^FTSE", "index_nikkei": "^N225"},
+    "stocks": {"stock_aapl": "AAPL", "stock_tsla": "TSLA", "stock_goog": "GOOG", "stock_msft": "MSFT", "stock_amzn": "AMZN"}
+}
+
 def get_main_keyboard():
     return InlineKeyboardMarkup([
         [InlineKeyboardButton("📊 Bulk Analysis", callback_data="bulk_button")],
@@ -0,0 +1,44 @@
+import asyncio
+import importlib
+import sys
+from types import ModuleType
+from typing import Awaitable, Callable, Iterable
+from telegram import Update
+from telegram.ext import ContextTypes
+
+# Handler modules that pull in pandas, ccxt, yfinance or PIL, plus the libraries themselves.
+HEAVY_MODULES = (
+    "bot.handlers.analysis",
+    "bot.handlers.alerts",
+    "bot.handlers.bulk",
+    "yfinance",
+    "ccxt",
+    "PIL.Image",
+    "PIL.ImageDraw"
+)
+
+async def load(module: str) -> ModuleType:
+    loaded = sys.modules.get(module)
+    if loaded is not None and not getattr(getattr(loaded, "__spec__", None), "_initializing", False):
+        return loaded
+    # Imports run in a thread so the event loop keeps answering menus while pandas and friends load.
+    return await asyncio.to_thread(importlib.import_module, module)
+
+def lazy_callback(module: str, name: str) -> Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[None]]:
+    resolved = None
+
+    async def callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        nonlocal resolved
+        if resolved is None:
+            resolved = getattr(await load(module), name)
+        await resolved(update, context)
+
+    callback.__name__ = name
+    return callback
+
+async def preload(modules: Iterable[str] = HEAVY_MODULES) -> None:
+    for module in modules:
+        try:
+            await load(module)
+        except Exception as e:
+            print(f"Failed to preload {module}: {str(e)}")
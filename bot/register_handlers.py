@@ -8,19 +8,26 @@ from bot.handlers.analysis_type import analysis_type_callback
 from bot.handlers.ticker import ticker_callback
 from bot.handlers.interval import interval_callback
 from bot.handlers.period import period_callback
-from bot.handlers.analysis import signal_callback
 from bot.handlers.asset_type import asset_type_callback
+from bot.handlers.profile import profile_command
+from bot.lazy import lazy_callback
+from core.config import owner_id
+
+# Signal, scan and alert handlers import pandas, ccxt and yfinance; they load on first use (or via preload).
+signal_callback = lazy_callback("bot.handlers.analysis", "signal_callback")
+scan_command = lazy_callback("bot.handlers.bulk", "scan_command")
+subscribe_command = lazy_callback("bot.handlers.alerts", "subscribe_command")
+unsubscribe_command = lazy_callback("bot.handlers.alerts", "unsubscribe_command")
+subscriptions_command = lazy_callback("bot.handlers.alerts", "subscriptions_command")
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.message.from_user
     username = user.username if user.username else "No username"
     user_id = user.id
 
-    OWNER_ID = "1423681267" 
-
     try:
         await context.bot.send_message(
-            chat_id=OWNER_ID,
+            chat_id=owner_id,
             text=f"New user started the bot!\nUsername: @{username}\nUser ID: {user_id}"
         )
     except Exception as e:
@@ -34,6 +41,11 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 def register_handlers(app):
     app.add_handler(CommandHandler("start", start))
+    app.add_handler(CommandHandler("scan", scan_command))
+    app.add_handler(CommandHandler("subscribe", subscribe_command))
+    app.add_handler(CommandHandler("unsubscribe", unsubscribe_command))
+    app.add_handler(CommandHandler("subscriptions", subscriptions_command))
+    app.add_handler(CommandHandler("profile", profile_command))
     app.add_handler(CallbackQueryHandler(analysis_type_callback, pattern="^(bulk_button|single_button|back_button)$"))
     app.add_handler(CallbackQueryHandler(asset_type_callback, pattern="^(commodities|crypto|forex|indices|stocks|back_to_asset_type)$"))
     app.add_handler(CallbackQueryHandler(ticker_callback, pattern="^(stock.*|crypto.*|forex.*|commodity.*|index.*|back_to_asset_type)$"))
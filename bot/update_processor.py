@@ -0,0 +1,59 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+SLOW_CALLBACKS = {"generate_signal", "bulk_button"}
+SLOW_COMMANDS = ("/scan", "/subscribe")
+# The base class enters its own semaphore before do_process_update; keep it out of the way.
+UNBOUNDED = 2 ** 31 - 1
+
+def is_slow_update(update: object) -> bool:
+    if not isinstance(update, Update):
+        return False
+    if update.callback_query is not None:
+        return update.callback_query.data in SLOW_CALLBACKS
+    text = update.message.text if update.message is not None and update.message.text else ""
+    return text.split("@")[0].split(" ")[0] in SLOW_COMMANDS
+
+def chat_key(update: object) -> Optional[int]:
+    if isinstance(update, Update) and update.effective_chat is not None:
+        return update.effective_chat.id
+    return None
+
+class ChatOrderedUpdateProcessor(BaseUpdateProcessor):
+    def __init__(self, max_concurrent_updates: int, max_slow_updates: int, is_slow: Callable[[object], bool] = is_slow_update):
+        # Budgets are taken after the chat lock, so an update waiting on its chat or on the
+        # slow budget holds no slot that a menu callback from another chat could use.
+        super().__init__(UNBOUNDED)
+        self.is_slow = is_slow
+        self._fast = asyncio.Semaphore(max_concurrent_updates)
+        self._slow = asyncio.Semaphore(max_slow_updates)
+        self._chat_locks: Dict[int, asyncio.Lock] = {}
+        self._chat_pending: Dict[int, int] = {}
+
+    async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        chat_id = chat_key(update)
+        if chat_id is None:
+            await self.run(update, coroutine)
+            return
+        lock = self._chat_locks.setdefault(chat_id, asyncio.Lock())
+        self._chat_pending[chat_id] = self._chat_pending.get(chat_id, 0) + 1
+        try:
+            async with lock:
+                await self.run(update, coroutine)
+        finally:
+            self._chat_pending[chat_id] -= 1
+            if not self._chat_pending[chat_id]:
+                del self._chat_pending[chat_id]
+                del self._chat_locks[chat_id]
+
+    async def run(self, update: object, coroutine: Awaitable[Any]) -> None:
+        async with self._slow if self.is_slow(update) else self._fast:
+            await coroutine
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
@@ -0,0 +1,41 @@
+import hmac
+from typing import Optional
+from aiohttp import web
+from telegram import Update
+from telegram.ext import Application
+from core.metrics import registry
+
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+def build_web_app(application: Application, webhook_path: Optional[str] = None, secret: Optional[str] = None) -> web.Application:
+    async def health(request: web.Request) -> web.Response:
+        return web.Response(text="Bot is running")
+
+    async def metrics(request: web.Request) -> web.Response:
+        return web.Response(body=registry.render().encode(), headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"})
+
+    async def webhook(request: web.Request) -> web.Response:
+        if secret and not hmac.compare_digest(request.headers.get(SECRET_HEADER, ""), secret):
+            return web.Response(status=403)
+        try:
+            update = Update.de_json(await request.json(), application.bot)
+        except ValueError:
+            return web.Response(status=400)
+        await application.update_queue.put(update)
+        return web.Response()
+
+    web_app = web.Application()
+    web_app.router.add_get("/", health)
+    web_app.router.add_get("/metrics", metrics)
+    if webhook_path:
+        web_app.router.add_post(webhook_path, webhook)
+    # Health checks may probe any path (e.g. /health); every other GET answers like /.
+    web_app.router.add_get("/{tail:.*}", health)
+    return web_app
+
+async def start_web_server(application: Application, port: int, webhook_path: Optional[str] = None, secret: Optional[str] = None) -> web.AppRunner:
+    runner = web.AppRunner(build_web_app(application, webhook_path, secret), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "0.0.0.0", port).start()
+    print(f"HTTP server running on port {port}")
+    return runner
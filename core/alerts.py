@@ -0,0 +1,170 @@
+import asyncio
+import heapq
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+SubscriptionKey = Tuple[str, str, str, str, str]
+
+class SubscriptionRegistry:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._groups: Dict[SubscriptionKey, Dict[int, Optional[float]]] = {}
+        self._lock = threading.Lock()
+        # Saves run on I/O threads; one at a time, so the file always ends with the latest snapshot.
+        self._save_lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        with open(self.path) as f:
+            entries = json.load(f)
+        with self._lock:
+            for entry in entries:
+                self._groups.setdefault(tuple(entry['key']), {})[int(entry['chat_id'])] = entry['threshold']
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._save_lock:
+            with self._lock:
+                entries = [
+                    {'key': list(key), 'chat_id': chat_id, 'threshold': threshold}
+                    for key, subscribers in self._groups.items()
+                    for chat_id, threshold in subscribers.items()
+                ]
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp = f"{self.path}.tmp"
+            with open(tmp, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp, self.path)
+
+    def subscribe(self, chat_id: int, key: SubscriptionKey, threshold: Optional[float] = None) -> None:
+        with self._lock:
+            self._groups.setdefault(key, {})[chat_id] = threshold
+        self.save()
+
+    def unsubscribe(self, chat_id: int, symbol: Optional[str] = None) -> int:
+        removed = 0
+        with self._lock:
+            for key in list(self._groups):
+                if symbol is not None and key[0] != symbol:
+                    continue
+                if chat_id not in self._groups[key]:
+                    continue
+                del self._groups[key][chat_id]
+                removed += 1
+                if not self._groups[key]:
+                    del self._groups[key]
+        self.save()
+        return removed
+
+    def for_chat(self, chat_id: int) -> List[Tuple[SubscriptionKey, Optional[float]]]:
+        with self._lock:
+            return [(key, subscribers[chat_id]) for key, subscribers in self._groups.items() if chat_id in subscribers]
+
+    def groups(self) -> List[SubscriptionKey]:
+        with self._lock:
+            return list(self._groups)
+
+    def subscribers(self, key: SubscriptionKey) -> Dict[int, Optional[float]]:
+        with self._lock:
+            return dict(self._groups.get(key, {}))
+
+class SendQueue:
+    def __init__(self, send: Callable[[int, str], Awaitable[Any]], global_rate: float = 30.0, per_chat_interval: float = 1.0):
+        self.send = send
+        self.global_interval = 1 / global_rate
+        self.per_chat_interval = per_chat_interval
+        self._pending: Dict[int, Deque[str]] = {}
+        self._ready: List[Tuple[float, int]] = []
+        self._next_chat: Dict[int, float] = {}
+        self._next_global = 0.0
+        self._wakeup = asyncio.Event()
+        self.sent = 0
+        self.failed = 0
+
+    def put(self, chat_id: int, text: str) -> None:
+        pending = self._pending.get(chat_id)
+        if pending is None:
+            pending = self._pending[chat_id] = deque()
+            heapq.heappush(self._ready, (self._next_chat.get(chat_id, 0.0), chat_id))
+        pending.append(text)
+        self._wakeup.set()
+
+    def backlog(self) -> int:
+        return sum(len(pending) for pending in self._pending.values())
+
+    async def run(self) -> None:
+        while True:
+            if not self._ready:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            ready_at, chat_id = self._ready[0]
+            delay = max(ready_at, self._next_global) - time.monotonic()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            heapq.heappop(self._ready)
+            pending = self._pending[chat_id]
+            text = pending[0]
+            now = time.monotonic()
+            self._next_global = now + self.global_interval
+            try:
+                await self.send(chat_id, text)
+                pending.popleft()
+                self.sent += 1
+                self._next_chat[chat_id] = now + self.per_chat_interval
+            except Exception as e:
+                retry_after = getattr(e, 'retry_after', None)
+                if retry_after is None:
+                    pending.popleft()
+                    self.failed += 1
+                    print(f"Failed to send alert to {chat_id}: {str(e)}")
+                    self._next_chat[chat_id] = now + self.per_chat_interval
+                else:
+                    retry_after = getattr(retry_after, 'total_seconds', lambda: retry_after)()
+                    self._next_chat[chat_id] = now + retry_after
+                    self._next_global = max(self._next_global, now + retry_after)
+            if pending:
+                heapq.heappush(self._ready, (self._next_chat[chat_id], chat_id))
+            else:
+                del self._pending[chat_id]
+
+class AlertEngine:
+    def __init__(self, registry: SubscriptionRegistry, evaluate: Callable[[SubscriptionKey], Awaitable[Dict]], queue: SendQueue, format_alert: Callable[[SubscriptionKey, Dict, Tuple[str, float]], str]):
+        self.registry = registry
+        self.evaluate = evaluate
+        self.queue = queue
+        self.format_alert = format_alert
+        self._last: Dict[SubscriptionKey, Tuple[str, float]] = {}
+
+    async def evaluate_group(self, key: SubscriptionKey) -> None:
+        subscribers = self.registry.subscribers(key)
+        if not subscribers:
+            self._last.pop(key, None)
+            return
+        report = await self.evaluate(key)
+        if 'error' in report:
+            raise RuntimeError(report['error'])
+        state = (report['direction'], report['confidence'])
+        previous = self._last.get(key)
+        self._last[key] = state
+        if previous is None:
+            return
+        flipped = state[0] != previous[0]
+        text = None
+        for chat_id, threshold in subscribers.items():
+            crossed = threshold is not None and previous[1] < threshold <= state[1]
+            if flipped or crossed:
+                text = text or self.format_alert(key, report, previous)
+                self.queue.put(chat_id, text)
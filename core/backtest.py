@@ -0,0 +1,96 @@
+import itertools
+import numpy as np
+import pandas as pd
+from typing import Optional, Sequence
+from core.signal_engine import MarketData, IndicatorInputs, RSIIndicator, MACDIndicator, OBVIndicator, score_signals
+from core.executor import get_process_pool
+from core.config import backtest_chunk_size
+
+GRID_COLUMNS = ['rsi_period', 'rsi_buy', 'rsi_sell', 'macd_fast', 'macd_slow', 'macd_signal']
+METRIC_COLUMNS = ['Trades', 'Hit_Rate', 'Avg_Return', 'Max_Drawdown']
+
+def parameter_grid(rsi_period: Sequence[int] = (14,), rsi_buy: Sequence[float] = (30,), rsi_sell: Sequence[float] = (70,), macd_fast: Sequence[int] = (12,), macd_slow: Sequence[int] = (26,), macd_signal: Sequence[int] = (9,)) -> pd.DataFrame:
+    grid = pd.DataFrame(list(itertools.product(rsi_period, rsi_buy, rsi_sell, macd_fast, macd_slow, macd_signal)), columns=GRID_COLUMNS)
+    return grid[(grid['rsi_buy'] < grid['rsi_sell']) & (grid['macd_fast'] < grid['macd_slow'])].reset_index(drop=True)
+
+def crosses(above: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    cross = np.zeros_like(above)
+    cross[..., 1:] = above[..., 1:] & ~above[..., :-1] & valid[..., :-1]
+    return cross
+
+def next_true(mask: np.ndarray) -> np.ndarray:
+    n = mask.shape[-1]
+    candidates = np.where(mask, np.arange(n), n)
+    return np.minimum.accumulate(candidates[..., ::-1], axis=-1)[..., ::-1]
+
+def sweep(close: np.ndarray, volume: np.ndarray, grid: np.ndarray, chunk_size: int = 256) -> np.ndarray:
+    inputs = IndicatorInputs(close, volume)
+    n = len(close)
+    periods, period_index = np.unique(grid[:, 0].astype(int), return_inverse=True)
+    rsi = np.empty((len(periods), n))
+    for i, period in enumerate(periods):
+        RSIIndicator(int(period), 0, 0).compute(inputs, rsi[i, :, None])
+    triples, macd_index = np.unique(grid[:, 3:6].astype(int), axis=0, return_inverse=True)
+    macd_above = np.empty((len(triples), n), dtype=bool)
+    macd_below = np.empty((len(triples), n), dtype=bool)
+    macd = np.empty((n, 2))
+    for i, (fast, slow, signal) in enumerate(triples):
+        MACDIndicator(int(fast), int(slow), int(signal)).compute(inputs, macd)
+        macd_above[i] = macd[:, 0] > macd[:, 1]
+        macd_below[i] = macd[:, 0] < macd[:, 1]
+    obv = np.empty((n, 1))
+    OBVIndicator().compute(inputs, obv)
+    obv_valid = ~np.isnan(obv[:, 0])
+    obv_up = np.zeros(n, dtype=bool)
+    obv_up[1:] = obv[1:, 0] > obv[:-1, 0]
+
+    metrics = np.empty((len(grid), len(METRIC_COLUMNS)))
+    for start in range(0, len(grid), chunk_size):
+        rows = slice(start, start + chunk_size)
+        chunk_rsi = rsi[period_index[rows]]
+        buy = grid[rows, 1:2]
+        sell = grid[rows, 2:3]
+        valid = ~np.isnan(chunk_rsi) & obv_valid
+        # generate_signals diffs OBV over the kept rows, so the first scored bar has no trend.
+        obv_trend = np.zeros(valid.shape, dtype=bool)
+        obv_trend[..., 1:] = obv_up[1:] & valid[..., :-1]
+        signal, _ = score_signals(
+            chunk_rsi, chunk_rsi < buy, chunk_rsi > sell,
+            crosses(macd_above[macd_index[rows]], valid), crosses(macd_below[macd_index[rows]], valid),
+            obv_trend, buy, sell
+        )
+        signal[~valid] = 0
+
+        returns = np.zeros(signal.shape)
+        traded = np.zeros(signal.shape, dtype=bool)
+        for direction, exits in ((1, chunk_rsi > sell), (-1, chunk_rsi < buy)):
+            exit_at = next_true(exits)
+            entries = (signal == direction) & (exit_at < n)
+            exit_close = close[np.minimum(exit_at, n - 1)]
+            returns[entries] = (direction * (exit_close - close) / close)[entries]
+            traded |= entries
+        trades = traded.sum(axis=1)
+        equity = np.cumsum(returns, axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            metrics[rows, 0] = trades
+            metrics[rows, 1] = ((returns > 0) & traded).sum(axis=1) / trades
+            metrics[rows, 2] = returns.sum(axis=1) / trades
+        metrics[rows, 3] = (np.maximum.accumulate(equity, axis=1) - equity).max(axis=1)
+    return metrics
+
+def backtest(data: MarketData, grid: pd.DataFrame, chunk_size: int = backtest_chunk_size, parallel: Optional[bool] = None) -> pd.DataFrame:
+    inputs = data.inputs()
+    values = grid[GRID_COLUMNS].to_numpy(dtype=np.float64)
+    chunks = [values[start:start + chunk_size] for start in range(0, len(values), chunk_size)]
+    if parallel is None:
+        parallel = len(chunks) > 1
+    if parallel:
+        pool = get_process_pool()
+        futures = [pool.submit(sweep, inputs.close, inputs.volume, chunk, chunk_size) for chunk in chunks]
+        metrics = np.vstack([future.result() for future in futures])
+    else:
+        metrics = sweep(inputs.close, inputs.volume, values, chunk_size)
+    result = grid.reset_index(drop=True).copy()
+    result[METRIC_COLUMNS] = metrics
+    result['Trades'] = result['Trades'].astype(int)
+    return result.sort_values('Avg_Return', ascending=False, na_position='last').reset_index(drop=True)
@@ -0,0 +1,150 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+import pandas as pd
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from core.signal_engine import DataProvider, MarketData, CompactMarketData, INTERVAL_MS
+
+def next_candle_close(interval: str, now: Optional[float] = None) -> float:
+    now = time.time() if now is None else now
+    step = INTERVAL_MS.get(interval, 60 * 1000) / 1000
+    return (now // step + 1) * step
+
+# Expired entries are also swept on put at most this often, so keys nobody reads again still leave.
+PURGE_INTERVAL = 60.0
+
+def sizeof(value: Any) -> int:
+    if isinstance(value, MarketData):
+        return sizeof(value.df)
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    if isinstance(value, (bytes, str)):
+        return len(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(k) + sizeof(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(sizeof(v) for v in value)
+    nbytes = getattr(value, 'nbytes', None)
+    return int(nbytes) if nbytes is not None else sys.getsizeof(value)
+
+class OHLCVCache:
+    def __init__(self, max_bytes: int, max_age: Optional[float] = None):
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._purge_at = time.time() + PURGE_INTERVAL
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at, nbytes = entry
+            if time.time() >= expires_at:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, expires_at: float) -> None:
+        if self.max_age is not None:
+            expires_at = min(expires_at, time.time() + self.max_age)
+        nbytes = sizeof(value)
+        with self._lock:
+            now = time.time()
+            if now >= self._purge_at:
+                self._purge(now)
+            if key in self._entries:
+                self._remove(key)
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (value, expires_at, nbytes)
+            self.size += nbytes
+            while self.size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _purge(self, now: float) -> None:
+        for key in [key for key, (_, expires_at, _) in self._entries.items() if now >= expires_at]:
+            self._remove(key)
+            self.expirations += 1
+        self._purge_at = now + PURGE_INTERVAL
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, nbytes = self._entries.pop(key)
+        self.size -= nbytes
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_ratio': self.hits / lookups if lookups else 0.0
+            }
+
+class CachedDataProvider(DataProvider):
+    def __init__(self, provider: DataProvider, cache: OHLCVCache, compact: bool = False):
+        self.provider = provider
+        self.cache = cache
+        self.compact = compact
+
+    def pack(self, data: MarketData, detach: bool = False):
+        if self.compact:
+            return CompactMarketData.from_frame(data.df)
+        # Batch results are views into one multi-ticker download; a cached view would pin the whole
+        # block while sizeof only charges the slice, so keep a copy instead.
+        return MarketData(data.df.copy()) if detach else data
+
+    def fetch_data(self, symbol: str, period: str, interval: str, asset_type: str) -> MarketData:
+        key = (type(self.provider).__name__, symbol, interval, period)
+        data = self.cache.get(key)
+        if data is None:
+            data = self.pack(self.provider.fetch_data(symbol, period, interval, asset_type))
+            self.cache.put(key, data, next_candle_close(interval))
+        return data
+
+    def fetch_many(self, symbols: List[str], period: str, interval: str) -> Tuple[Dict[str, MarketData], Dict[str, str]]:
+        name = type(self.provider).__name__
+        results: Dict[str, MarketData] = {}
+        missing = []
+        for symbol in symbols:
+            data = self.cache.get((name, symbol, interval, period))
+            if data is None:
+                missing.append(symbol)
+            else:
+                results[symbol] = data
+        errors: Dict[str, str] = {}
+        if missing:
+            fetched, errors = self.provider.fetch_many(missing, period, interval)
+            for symbol, data in fetched.items():
+                data = self.pack(data, detach=True)
+                self.cache.put((name, symbol, interval, period), data, next_candle_close(interval))
+                results[symbol] = data
+        return results, errors
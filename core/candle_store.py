@@ -0,0 +1,135 @@
+import json
+import os
+import re
+import threading
+import time
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple
+from core.signal_engine import INTERVAL_MS
+
+RECORD_DTYPE = np.dtype([
+    ('ts', '<i8'), ('Open', '<f8'), ('High', '<f8'), ('Low', '<f8'), ('Close', '<f8'), ('Volume', '<f8')
+])
+DAY_MS = 24 * 60 * 60 * 1000
+
+class CandleStore:
+    def __init__(self, root: str):
+        self.root = root
+        self._last_ts: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def _dir(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, re.sub(r'[^A-Za-z0-9._=-]', '_', symbol), interval)
+
+    def _read_meta(self, directory: str) -> Optional[dict]:
+        try:
+            with open(os.path.join(directory, 'meta.json')) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _partitions(self, directory: str):
+        try:
+            return sorted(name for name in os.listdir(directory) if name.endswith('.bin'))
+        except OSError:
+            return []
+
+    def _open(self, path: str) -> np.ndarray:
+        # A torn append (process killed mid-write) leaves a partial record at the end; read whole records only.
+        count = os.path.getsize(path) // RECORD_DTYPE.itemsize
+        if not count:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        return np.memmap(path, dtype=RECORD_DTYPE, mode='r', shape=(count,))
+
+    def _write(self, path: str, chunk: np.ndarray) -> None:
+        with open(path, 'ab') as f:
+            torn = f.tell() % RECORD_DTYPE.itemsize
+            if torn:
+                f.truncate(f.tell() - torn)
+            f.write(chunk.tobytes())
+
+    def _write_meta(self, directory: str, meta: dict) -> None:
+        path = os.path.join(directory, 'meta.json')
+        with open(path + '.tmp', 'w') as f:
+            json.dump(meta, f)
+        os.replace(path + '.tmp', path)
+
+    def last_timestamp(self, symbol: str, interval: str) -> Optional[int]:
+        key = (symbol, interval)
+        if key not in self._last_ts:
+            directory = self._dir(symbol, interval)
+            partitions = self._partitions(directory)
+            records = self._open(os.path.join(directory, partitions[-1])) if partitions else []
+            self._last_ts[key] = int(records[-1]['ts']) if len(records) else None
+        return self._last_ts[key]
+
+    def coverage(self, symbol: str, interval: str) -> Optional[int]:
+        meta = self._read_meta(self._dir(symbol, interval))
+        return meta['covered_from'] if meta else None
+
+    def append(self, symbol: str, interval: str, df: pd.DataFrame, covered_from: Optional[int] = None) -> int:
+        if df.empty:
+            return 0
+        step = INTERVAL_MS.get(interval, 60 * 1000)
+        index = df.index.tz_convert('UTC') if df.index.tz is not None else df.index
+        ts = index.as_unit('ms').asi8
+        with self._lock:
+            last = self.last_timestamp(symbol, interval)
+            closed = ts + step <= time.time() * 1000
+            rows = np.flatnonzero(closed & (ts > (last if last is not None else -1)))
+            if not len(rows):
+                return 0
+            records = np.empty(len(rows), dtype=RECORD_DTYPE)
+            records['ts'] = ts[rows]
+            for column in ['Open', 'High', 'Low', 'Close', 'Volume']:
+                records[column] = df[column].to_numpy(dtype=np.float64)[rows]
+
+            directory = self._dir(symbol, interval)
+            os.makedirs(directory, exist_ok=True)
+            meta = self._read_meta(directory)
+            # A full download that starts after the stored tail leaves a hole: start a new segment from it.
+            if meta is None or last is None or (covered_from is not None and last < covered_from):
+                segment_start = int(covered_from if covered_from is not None else records['ts'][0])
+                self._write_meta(directory, {
+                    'covered_from': segment_start,
+                    'tz': str(df.index.tz) if df.index.tz is not None else None,
+                    'index_name': df.index.name
+                })
+                self._drop_before(directory, segment_start)
+            days = records['ts'] // DAY_MS
+            bounds = np.flatnonzero(np.diff(days)) + 1
+            for chunk in np.split(records, bounds):
+                day = pd.Timestamp(int(chunk['ts'][0]), unit='ms').strftime('%Y-%m-%d')
+                self._write(os.path.join(directory, f"{day}.bin"), chunk)
+            self._last_ts[(symbol, interval)] = int(records['ts'][-1])
+            return len(records)
+
+    def _drop_before(self, directory: str, ts: int) -> None:
+        first_day = pd.Timestamp(ts, unit='ms').strftime('%Y-%m-%d')
+        for name in self._partitions(directory):
+            if name[:-4] < first_day:
+                os.remove(os.path.join(directory, name))
+
+    def load(self, symbol: str, interval: str, since_ms: Optional[int] = None) -> Optional[pd.DataFrame]:
+        directory = self._dir(symbol, interval)
+        meta = self._read_meta(directory)
+        if meta is None:
+            return None
+        since_ms = meta['covered_from'] if since_ms is None else max(since_ms, meta['covered_from'])
+        first_day = pd.Timestamp(since_ms, unit='ms').strftime('%Y-%m-%d')
+        parts = [
+            self._open(os.path.join(directory, name))
+            for name in self._partitions(directory)
+            if name[:-4] >= first_day
+        ]
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return None
+        records = np.concatenate(parts)
+        records = records[records['ts'] >= since_ms]
+        index = pd.to_datetime(records['ts'], unit='ms')
+        if meta.get('tz'):
+            index = index.tz_localize('UTC').tz_convert(meta['tz'])
+        index.name = meta.get('index_name')
+        return pd.DataFrame({column: records[column] for column in ['Open', 'High', 'Low', 'Close', 'Volume']}, index=index)
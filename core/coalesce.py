@@ -0,0 +1,31 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class RequestCoalescer:
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.requests = 0
+        self.executions = 0
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        self.requests += 1
+        future = self._inflight.get(key)
+        if future is None:
+            self.executions += 1
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def stats(self) -> Dict[str, float]:
+        coalesced = self.requests - self.executions
+        return {
+            'requests': self.requests,
+            'executions': self.executions,
+            'coalesced': coalesced,
+            'in_flight': len(self._inflight),
+            'coalescing_ratio': coalesced / self.requests if self.requests else 0.0
+        }
@@ -1,7 +1,48 @@
 import os
+import secrets
 from dotenv import load_dotenv
 
 load_dotenv()
 
 tg_bot_token= os.getenv("TG_BOT_TOKEN")
-backend_url = os.getenv("BACKEND_URL") 
\ No newline at end of file
+backend_url = os.getenv("BACKEND_URL") 
+cache_max_mb = int(os.getenv("CACHE_MAX_MB", 256))
+cache_max_age = int(os.getenv("CACHE_MAX_AGE", 900))
+held_frames_mb = int(os.getenv("HELD_FRAMES_MB", 256))
+incremental_fetch = os.getenv("INCREMENTAL_FETCH", "true").lower() == "true"
+binance_max_concurrency = int(os.getenv("BINANCE_MAX_CONCURRENCY", 4))
+markets_refresh_seconds = int(os.getenv("MARKETS_REFRESH_SECONDS", 3600))
+exchange_pool_size = int(os.getenv("EXCHANGE_POOL_SIZE", 16))
+io_workers = int(os.getenv("IO_WORKERS", 16))
+cpu_workers = int(os.getenv("CPU_WORKERS", os.cpu_count() or 2))
+fetch_timeout = float(os.getenv("FETCH_TIMEOUT", 20))
+compute_timeout = float(os.getenv("COMPUTE_TIMEOUT", 30))
+scan_workers = int(os.getenv("SCAN_WORKERS", os.cpu_count() or 2))
+scan_yahoo_batch_size = int(os.getenv("SCAN_YAHOO_BATCH_SIZE", 50))
+scan_yahoo_concurrency = int(os.getenv("SCAN_YAHOO_CONCURRENCY", 2))
+scan_binance_concurrency = int(os.getenv("SCAN_BINANCE_CONCURRENCY", 4))
+scan_timeout = float(os.getenv("SCAN_TIMEOUT", 120))
+resample_intraday = os.getenv("RESAMPLE_INTRADAY", "true").lower() == "true"
+resample_base_period = os.getenv("RESAMPLE_BASE_PERIOD", "30d")
+candle_store_dir = os.getenv("CANDLE_STORE_DIR", "data/candles")
+cache_compact = os.getenv("CACHE_COMPACT", "false").lower() == "true"
+prewarm_enabled = os.getenv("PREWARM_ENABLED", "true").lower() == "true"
+prewarm_hot_set = os.getenv("PREWARM_HOT_SET", "")
+prewarm_concurrency = int(os.getenv("PREWARM_CONCURRENCY", 4))
+prewarm_jitter = float(os.getenv("PREWARM_JITTER", 5))
+alerts_file = os.getenv("ALERTS_FILE", "data/subscriptions.json")
+alert_global_rate = float(os.getenv("ALERT_GLOBAL_RATE", 30))
+alert_chat_interval = float(os.getenv("ALERT_CHAT_INTERVAL", 1))
+render_cache_mb = int(os.getenv("RENDER_CACHE_MB", 32))
+backtest_chunk_size = int(os.getenv("BACKTEST_CHUNK_SIZE", 256))
+bot_mode = os.getenv("BOT_MODE", "webhook" if backend_url else "polling").lower()
+webhook_path = os.getenv("WEBHOOK_PATH", "/webhook")
+webhook_secret = os.getenv("WEBHOOK_SECRET") or secrets.token_urlsafe(32)
+update_concurrency = int(os.getenv("UPDATE_CONCURRENCY", 256))
+slow_update_concurrency = int(os.getenv("SLOW_UPDATE_CONCURRENCY", 8))
+preload_enabled = os.getenv("PRELOAD_ENABLED", "true").lower() == "true"
+owner_id = os.getenv("OWNER_ID", "1423681267")
+profile_dir = os.getenv("PROFILE_DIR", "data/profiles")
+profile_sample_rate = float(os.getenv("PROFILE_SAMPLE_RATE", 0))
+profile_keep = int(os.getenv("PROFILE_KEEP", 200))
+alert_max_per_chat = int(os.getenv("ALERT_MAX_PER_CHAT", 20))
@@ -1,29 +1,38 @@
 import os
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from core.signal_engine import YahooFinanceDataProvider, BinanceDataProvider, RSIIndicator, MACDIndicator, OBVIndicator, DynamicSignalGenerator
+from core.signal_engine import YahooFinanceDataProvider, BinanceDataProvider, RSIIndicator, MACDIndicator, OBVIndicator, DynamicSignalGenerator, VALID_PERIODS
+from core.cache import OHLCVCache, CachedDataProvider
+from core.resample import ResamplingDataProvider
+from core.candle_store import CandleStore
+from core.metrics import registry
+from core.config import cache_max_mb, cache_max_age, held_frames_mb, incremental_fetch, binance_max_concurrency, resample_intraday, resample_base_period, candle_store_dir, cache_compact
 
 
 from typing import Dict, Optional, List
 
+ohlcv_cache = OHLCVCache(max_bytes=cache_max_mb * 1024 * 1024, max_age=cache_max_age)
+registry.register_stats("cache", ohlcv_cache.stats, cache="ohlcv")
+# Full-span frames the providers keep for incremental fetches and resampling; evicted ones reload from the candle store.
+held_frames = OHLCVCache(max_bytes=held_frames_mb * 1024 * 1024)
+registry.register_stats("cache", held_frames.stats, cache="frames")
+candle_store = CandleStore(candle_store_dir) if candle_store_dir else None
+binance_source = BinanceDataProvider(incremental=incremental_fetch, max_concurrency=binance_max_concurrency, store=candle_store, frames=held_frames)
+if resample_intraday:
+    binance_source = ResamplingDataProvider(binance_source, base_period=resample_base_period, frames=held_frames)
+binance_provider = CachedDataProvider(binance_source, ohlcv_cache, compact=cache_compact)
+yahoo_provider = CachedDataProvider(YahooFinanceDataProvider(incremental=incremental_fetch, store=candle_store, frames=held_frames), ohlcv_cache, compact=cache_compact)
+
 def validate_period_interval(period: str, interval: str) -> bool:
-    valid_combinations = {
-        "1m": ["7d", "14d", "30d"],
-        "5m": ["7d", "14d", "30d"],
-        "15m": ["7d", "14d", "30d"],
-        "30m": ["7d", "14d", "30d"],
-        "1h": ["14d", "30d", "6mo"],
-        "1d": ["30d", "6mo", "1y"]
-    }
-    return period in valid_combinations.get(interval, [])
+    return period in VALID_PERIODS.get(interval, [])
 
 def get_data_provider(asset_type: str, symbol: str) -> tuple:
     match asset_type:
         case 'crypto':
-            provider = BinanceDataProvider()
+            provider = binance_provider
             symbol = symbol.replace('-', '/')
         case 'stocks' | 'indices' | 'commodities' | 'forex':
-            provider = YahooFinanceDataProvider()
+            provider = yahoo_provider
         case _:
             raise ValueError(f"Unsupported asset type: {asset_type}")
     return provider, symbol
@@ -44,7 +53,8 @@ def generate_rsi_signal(
     interval: Optional[str] = None,
     rsi_period: int = 14,
     rsi_buy: Optional[float] = None,
-    rsi_sell: Optional[float] = None
+    rsi_sell: Optional[float] = None,
+    live: bool = False
 ) -> Dict[str, any]:
     try:
         config = get_default_config(asset_type)
@@ -62,7 +72,7 @@ def generate_rsi_signal(
         market_data = provider.fetch_data(symbol, selected_period, selected_interval, asset_type)
 
         indicators = [RSIIndicator(period=rsi_period, buy_threshold=config[asset_type]['rsi_buy'], sell_threshold=config[asset_type]['rsi_sell'])]
-        signal_generator = DynamicSignalGenerator(config)
+        signal_generator = DynamicSignalGenerator(config, live=live)
         result = signal_generator.generate_signals(market_data, indicators, symbol, asset_type)
 
         return {'signal': result.to_dict(orient='records')[0]}
@@ -76,7 +86,8 @@ def generate_macd_signal(
     interval: Optional[str] = None,
     macd_fast: int = 12,
     macd_slow: int = 26,
-    macd_signal: int = 9
+    macd_signal: int = 9,
+    live: bool = False
 ) -> Dict[str, any]:
     try:
         config = get_default_config(asset_type)
@@ -90,7 +101,7 @@ def generate_macd_signal(
         market_data = provider.fetch_data(symbol, selected_period, selected_interval, asset_type)
 
         indicators = [MACDIndicator(fast=macd_fast, slow=macd_slow, signal=macd_signal)]
-        signal_generator = DynamicSignalGenerator(config)
+        signal_generator = DynamicSignalGenerator(config, live=live)
         result = signal_generator.generate_signals(market_data, indicators, symbol, asset_type)
 
         return {'signal': result.to_dict(orient='records')[0]}
@@ -101,7 +112,8 @@ def generate_obv_signal(
     symbol: str,
     asset_type: str,
     period: Optional[str] = None,
-    interval: Optional[str] = None
+    interval: Optional[str] = None,
+    live: bool = False
 ) -> Dict[str, any]:
     try:
         config = get_default_config(asset_type)
@@ -115,7 +127,7 @@ def generate_obv_signal(
         market_data = provider.fetch_data(symbol, selected_period, selected_interval, asset_type)
 
         indicators = [OBVIndicator()]
-        signal_generator = DynamicSignalGenerator(config)
+        signal_generator = DynamicSignalGenerator(config, live=live)
         result = signal_generator.generate_signals(market_data, indicators, symbol, asset_type)
 
         return {'signal': result.to_dict(orient='records')[0]}
@@ -133,7 +145,8 @@ def generate_combined_signal(
     macd_fast: int = 12,
     macd_slow: int = 26,
     macd_signal: int = 9,
-    indicators: Optional[List[str]] = None
+    indicators: Optional[List[str]] = None,
+    live: bool = False
 ) -> Dict[str, any]:
     try:
         config = get_default_config(asset_type)
@@ -163,7 +176,7 @@ def generate_combined_signal(
         if not selected_indicators:
             raise ValueError("No valid indicators selected")
 
-        signal_generator = DynamicSignalGenerator(config)
+        signal_generator = DynamicSignalGenerator(config, live=live)
         result = signal_generator.generate_signals(market_data, selected_indicators, symbol, asset_type)
 
         return {'signal': result.to_dict(orient='records')[0]}
@@ -0,0 +1,57 @@
+import threading
+from typing import Any, Callable, Optional
+from requests.adapters import HTTPAdapter
+from core.config import markets_refresh_seconds, exchange_pool_size
+
+class ExchangePool:
+    def __init__(self, factory: Callable[[], Any], refresh_interval: float = 3600, pool_size: int = 16):
+        self.factory = factory
+        self.refresh_interval = refresh_interval
+        self.pool_size = pool_size
+        self._exchange: Optional[Any] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+
+    def get(self) -> Any:
+        if self._exchange is None:
+            with self._lock:
+                if self._exchange is None:
+                    exchange = self.factory()
+                    session = getattr(exchange, 'session', None)
+                    if session is not None and hasattr(session, 'mount'):
+                        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                        session.mount('https://', adapter)
+                        session.mount('http://', adapter)
+                    exchange.load_markets()
+                    self._exchange = exchange
+                    self._start_refresher()
+        return self._exchange
+
+    def _start_refresher(self) -> None:
+        if self.refresh_interval <= 0:
+            return
+        self._refresher = threading.Thread(target=self._refresh_loop, daemon=True)
+        self._refresher.start()
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self._exchange.load_markets(reload=True)
+            except Exception as e:
+                print(f"Failed to refresh markets: {str(e)}")
+
+    def close(self) -> None:
+        self._stop.set()
+        with self._lock:
+            exchange, self._exchange = self._exchange, None
+        session = getattr(exchange, 'session', None)
+        if session is not None and hasattr(session, 'close'):
+            session.close()
+
+def binance() -> Any:
+    # ccxt imports every exchange module up front; keep that off the startup path.
+    import ccxt
+    return ccxt.binance()
+
+binance_pool = ExchangePool(binance, refresh_interval=markets_refresh_seconds, pool_size=exchange_pool_size)
@@ -0,0 +1,37 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+from core.config import io_workers, cpu_workers, scan_workers
+
+io_pool = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="io")
+cpu_pool = ThreadPoolExecutor(max_workers=cpu_workers, thread_name_prefix="cpu")
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # Spawned workers avoid inheriting locks held by the bot's I/O threads at fork time.
+            _process_pool = ProcessPoolExecutor(max_workers=scan_workers, mp_context=multiprocessing.get_context("spawn"))
+        return _process_pool
+
+async def run_in_pool(pool: Executor, func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(pool, partial(func, *args, **kwargs))
+    return await asyncio.wait_for(future, timeout)
+
+async def run_io(func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+    return await run_in_pool(io_pool, func, *args, timeout=timeout, **kwargs)
+
+async def run_cpu(func: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+    return await run_in_pool(cpu_pool, func, *args, timeout=timeout, **kwargs)
+
+def shutdown() -> None:
+    io_pool.shutdown(wait=False, cancel_futures=True)
+    cpu_pool.shutdown(wait=False, cancel_futures=True)
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,67 @@
+import time
+import zlib
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+def synthetic_candles(start_ms: int, count: int, step_ms: int, seed: int = 0, start_price: float = 100.0, volatility: float = 0.002) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    close = start_price * np.exp(np.cumsum(rng.normal(0, volatility, count)))
+    open_ = np.empty(count)
+    open_[0] = start_price
+    open_[1:] = close[:-1]
+    spread = np.abs(rng.normal(0, volatility, count)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.lognormal(10, 1, count)
+    timestamps = start_ms + np.arange(count, dtype=np.int64) * step_ms
+    return timestamps, np.column_stack([open_, high, low, close, volume])
+
+class FakeExchange:
+    rateLimit = 50
+    max_limit = 1000
+    default_limit = 500
+
+    def __init__(self, seed: int = 0, now_ms: Optional[int] = None, history_ms: int = 400 * 24 * 60 * 60 * 1000, latency: float = 0.0, symbols: Optional[List[str]] = None):
+        self.seed = seed
+        self.now_ms = now_ms
+        self.history_ms = history_ms
+        self.latency = latency
+        self.symbols = symbols or ['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'BNB/USDT', 'ADA/USDT']
+        self.markets: Dict[str, dict] = {}
+        self.calls = 0
+        self._history: Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def milliseconds(self) -> int:
+        return self.now_ms if self.now_ms is not None else int(time.time() * 1000)
+
+    def parse_timeframe(self, timeframe: str) -> int:
+        units = {'m': 60, 'h': 60 * 60, 'd': 24 * 60 * 60, 'w': 7 * 24 * 60 * 60}
+        return int(timeframe[:-1]) * units[timeframe[-1]]
+
+    def load_markets(self, reload: bool = False) -> Dict[str, dict]:
+        if reload or not self.markets:
+            self.markets = {symbol: {'symbol': symbol, 'active': True} for symbol in self.symbols}
+        return self.markets
+
+    def fetch_ohlcv(self, symbol: str, timeframe: str = '1m', since: Optional[int] = None, limit: Optional[int] = None, params: Optional[dict] = None) -> List[list]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        limit = min(limit or self.default_limit, self.max_limit)
+        timestamps, values = self._candles(symbol, timeframe)
+        if since is None:
+            start = max(0, len(timestamps) - limit)
+        else:
+            start = int(np.searchsorted(timestamps, since, side='left'))
+        rows = slice(start, start + limit)
+        return [[int(ts), *candle] for ts, candle in zip(timestamps[rows], values[rows].tolist())]
+
+    def _candles(self, symbol: str, timeframe: str) -> Tuple[np.ndarray, np.ndarray]:
+        key = (symbol, timeframe)
+        if key not in self._history:
+            step = self.parse_timeframe(timeframe) * 1000
+            last = self.milliseconds() // step * step
+            count = self.history_ms // step + 1
+            seed = zlib.crc32(f"{self.seed}:{symbol}:{timeframe}".encode())
+            self._history[key] = synthetic_candles(last - (count - 1) * step, count, step, seed=seed)
+        return self._history[key]
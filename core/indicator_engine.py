@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+from functools import cached_property
+from typing import List, Sequence, Tuple
+
+class IndicatorInputs:
+    def __init__(self, close: np.ndarray, volume: np.ndarray):
+        self.close = close
+        self.volume = volume
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "IndicatorInputs":
+        return cls(df['Close'].to_numpy(dtype=np.float64), df['Volume'].to_numpy(dtype=np.float64))
+
+    @cached_property
+    def delta(self) -> np.ndarray:
+        delta = np.empty(len(self.close))
+        delta[:1] = np.nan
+        np.subtract(self.close[1:], self.close[:-1], out=delta[1:])
+        return delta
+
+def rolling_mean(values: np.ndarray, window: int, out: np.ndarray) -> np.ndarray:
+    out[:window - 1] = np.nan
+    if len(values) >= window:
+        np.lib.stride_tricks.sliding_window_view(values, window).mean(axis=-1, out=out[window - 1:])
+    return out
+
+def ewm_mean(values: np.ndarray, span: int, out: np.ndarray) -> np.ndarray:
+    out[:] = pd.Series(values, copy=False).ewm(span=span, adjust=False).mean().to_numpy()
+    return out
+
+def compute_indicators(inputs: IndicatorInputs, indicators: Sequence) -> Tuple[List[str], np.ndarray]:
+    names = ['Close'] + [column for indicator in indicators for column in indicator.columns]
+    block = np.empty((len(inputs.close), len(names)))
+    block[:, 0] = inputs.close
+    start = 1
+    for indicator in indicators:
+        width = len(indicator.columns)
+        indicator.compute(inputs, block[:, start:start + width])
+        start += width
+    return names, block
@@ -0,0 +1,72 @@
+import threading
+import time
+import weakref
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+class RequestPacer:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+_pacers: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_pacers_lock = threading.Lock()
+
+def get_pacer(exchange) -> RequestPacer:
+    with _pacers_lock:
+        pacer = _pacers.get(exchange)
+        if pacer is None:
+            pacer = _pacers[exchange] = RequestPacer(getattr(exchange, 'rateLimit', 0) / 1000)
+        return pacer
+
+def fetch_ohlcv_paginated(exchange, symbol: str, timeframe: str, since: int, until: Optional[int] = None, limit: int = 1000, max_concurrency: int = 4) -> Tuple[np.ndarray, np.ndarray]:
+    step = exchange.parse_timeframe(timeframe) * 1000
+    until = exchange.milliseconds() if until is None else until
+    first = -(-since // step) * step
+    last = until // step * step
+    count = max(0, (last - first) // step + 1)
+    pages = max(1, -(-count // limit))
+    page_span = limit * step
+
+    timestamps = np.empty(pages * limit, dtype=np.int64)
+    values = np.empty((pages * limit, 5), dtype=np.float64)
+    filled = np.zeros(pages, dtype=np.int64)
+    pacer = get_pacer(exchange)
+
+    def load(page: int) -> None:
+        start = first + page * page_span
+        pacer.wait()
+        candles = exchange.fetch_ohlcv(symbol, timeframe, start, limit)
+        if not candles:
+            return
+        block = np.asarray(candles, dtype=np.float64)
+        block = block[block[:, 0] < start + page_span]
+        offset = page * limit
+        n = len(block)
+        timestamps[offset:offset + n] = block[:, 0]
+        values[offset:offset + n] = block[:, 1:6]
+        filled[page] = n
+
+    workers = max(1, min(max_concurrency, pages))
+    if workers == 1:
+        for page in range(pages):
+            load(page)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(load, range(pages)))
+
+    if (filled[:-1] == limit).all():
+        total = (pages - 1) * limit + filled[-1]
+        return timestamps[:total], values[:total]
+    mask = (np.arange(limit) < filled[:, None]).ravel()
+    return timestamps[mask], values[mask]
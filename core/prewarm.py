@@ -0,0 +1,52 @@
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Hashable, List, Optional, Sequence, Union
+from core.cache import next_candle_close
+
+class PrewarmScheduler:
+    def __init__(self, hot_set: Union[Sequence[Hashable], Callable[[], Sequence[Hashable]]], refresh: Callable[[Hashable], Awaitable[Any]], interval_of: Callable[[Hashable], str], concurrency: int = 4, jitter: float = 5.0, settle: float = 1.0, max_age: Optional[float] = None):
+        self.hot_set = hot_set if callable(hot_set) else list(hot_set)
+        self.refresh = refresh
+        self.interval_of = interval_of
+        self.max_age = max_age
+        self.jitter = jitter
+        self.settle = settle
+        self._budget = asyncio.Semaphore(concurrency)
+        self.runs = 0
+        self.failures = 0
+
+    async def warm(self, key: Hashable) -> None:
+        await asyncio.sleep(random.uniform(0, self.jitter))
+        async with self._budget:
+            try:
+                await self.refresh(key)
+                self.runs += 1
+            except Exception as e:
+                self.failures += 1
+                print(f"Prewarm failed for {key}: {str(e)}")
+
+    async def warm_all(self, keys: List[Hashable]) -> None:
+        await asyncio.gather(*(self.warm(key) for key in keys))
+
+    def next_refresh(self, key: Hashable, now: float) -> float:
+        close = next_candle_close(self.interval_of(key), now)
+        if self.max_age is not None:
+            close = min(close, (now // self.max_age + 1) * self.max_age)
+        return close
+
+    def due(self, close: float) -> List[Hashable]:
+        return [key for key in self.keys() if self.next_refresh(key, close - 1) == close]
+
+    def keys(self) -> List[Hashable]:
+        return list(self.hot_set()) if callable(self.hot_set) else self.hot_set
+
+    async def run(self) -> None:
+        if not callable(self.hot_set) and not self.hot_set:
+            return
+        await self.warm_all(self.keys())
+        while True:
+            now = time.time()
+            close = min((self.next_refresh(key, now) for key in self.keys()), default=next_candle_close('1m', now))
+            await asyncio.sleep(close - now + self.settle)
+            await self.warm_all(self.due(close))
@@ -0,0 +1,38 @@
+import time
+import zlib
+import pandas as pd
+from typing import Optional
+from core.signal_engine import DataProvider, MarketData, INTERVAL_MS, PERIOD_MS, trim_frame
+from core.candle_store import CandleStore
+from core.fake_exchange import synthetic_candles
+
+class SyntheticDataProvider(DataProvider):
+    def __init__(self, seed: int = 0, now_ms: Optional[int] = None, volatility: float = 0.002):
+        self.seed = seed
+        self.now_ms = now_ms
+        self.volatility = volatility
+
+    def fetch_data(self, symbol: str, period: str, interval: str, asset_type: str) -> MarketData:
+        step = INTERVAL_MS[interval]
+        now = self.now_ms if self.now_ms is not None else int(time.time() * 1000)
+        last = now // step * step
+        count = PERIOD_MS.get(period, PERIOD_MS['30d']) // step + 1
+        seed = zlib.crc32(f"{self.seed}:{symbol}:{interval}".encode())
+        timestamps, values = synthetic_candles(last - (count - 1) * step, count, step, seed=seed, volatility=self.volatility)
+        index = pd.to_datetime(timestamps, unit='ms')
+        index.name = 'Timestamp'
+        return MarketData(pd.DataFrame(values, index=index, columns=['Open', 'High', 'Low', 'Close', 'Volume']))
+
+class ReplayDataProvider(DataProvider):
+    def __init__(self, store: CandleStore):
+        self.store = store
+
+    def fetch_data(self, symbol: str, period: str, interval: str, asset_type: str) -> MarketData:
+        df = self.store.load(symbol, interval)
+        if df is None or df.empty:
+            raise RuntimeError(f"Failed to fetch data for {symbol}: no recorded {interval} candles in {self.store.root}")
+        return MarketData(trim_frame(df, PERIOD_MS.get(period, PERIOD_MS['30d'])))
+
+def record(provider: DataProvider, store: CandleStore, symbol: str, period: str, interval: str, asset_type: str) -> int:
+    df = provider.fetch_data(symbol, period, interval, asset_type).df
+    return store.append(symbol, interval, df, covered_from=int(df.index[0].timestamp() * 1000))
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, Sequence
+from core.signal_engine import DataProvider, MarketData, INTERVAL_MS, PERIOD_MS, merge_frames, trim_frame
+from core.cache import OHLCVCache
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+def resample_ohlcv(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    df = df[OHLCV_COLUMNS].dropna()
+    if df.empty:
+        return df
+    step = INTERVAL_MS[interval]
+    buckets = df.index.as_unit('ms').asi8 // step
+    starts = np.flatnonzero(np.diff(buckets, prepend=buckets[0] - 1))
+    ends = np.append(starts[1:], len(buckets)) - 1
+    values = df.to_numpy(dtype=np.float64)
+    bars = np.column_stack([
+        values[starts, 0],
+        np.maximum.reduceat(values[:, 1], starts),
+        np.minimum.reduceat(values[:, 2], starts),
+        values[ends, 3],
+        np.add.reduceat(values[:, 4], starts)
+    ])
+    index = pd.to_datetime(buckets[starts] * step, unit='ms', utc=df.index.tz is not None)
+    if df.index.tz is not None:
+        index = index.tz_convert(df.index.tz)
+    index.name = df.index.name
+    return pd.DataFrame(bars, index=index, columns=OHLCV_COLUMNS)
+
+class ResamplingDataProvider(DataProvider):
+    def __init__(self, provider: DataProvider, base_interval: str = '1m', base_period: str = '30d', derived: Sequence[str] = ('5m', '15m', '30m', '1h'), frames: Optional[OHLCVCache] = None):
+        self.provider = provider
+        self.base_interval = base_interval
+        self.base_period = base_period
+        self.derived = set(derived)
+        # Derived bars per symbol and interval, under the same byte budget as the source's held frames.
+        self.frames = frames if frames is not None else OHLCVCache(max_bytes=float('inf'))
+
+    def fetch_data(self, symbol: str, period: str, interval: str, asset_type: str) -> MarketData:
+        span = PERIOD_MS.get(period, PERIOD_MS['30d'])
+        if interval not in self.derived or span > PERIOD_MS[self.base_period]:
+            return self.provider.fetch_data(symbol, period, interval, asset_type)
+
+        base = self.provider.fetch_data(symbol, self.base_period, self.base_interval, asset_type).df
+        key = (type(self).__name__, symbol, interval)
+        held = self.frames.get(key)
+        if held is None or held.empty or base.index[0] > held.index[-1]:
+            bars = resample_ohlcv(base, interval)
+        else:
+            # Only the held frame's last (possibly partial) bar and anything after it can change.
+            bars = merge_frames(held, resample_ohlcv(base[base.index >= held.index[-1]], interval))
+        if bars.empty:
+            raise RuntimeError(f"Failed to fetch data for {symbol}: no {self.base_interval} bars to derive {interval} from")
+        bars = trim_frame(bars, PERIOD_MS[self.base_period])
+        self.frames.put(key, bars, float('inf'))
+        return MarketData(trim_frame(bars, span))
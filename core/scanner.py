@@ -0,0 +1,91 @@
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from core.signal_engine import MarketData, RSIIndicator, MACDIndicator, OBVIndicator, DynamicSignalGenerator
+from core.data import get_default_config, get_data_provider, validate_period_interval
+from core.executor import get_process_pool
+from core.config import scan_yahoo_batch_size, scan_yahoo_concurrency, scan_binance_concurrency
+
+def build_indicators(rsi_buy: float, rsi_sell: float) -> list:
+    return [
+        RSIIndicator(period=14, buy_threshold=rsi_buy, sell_threshold=rsi_sell),
+        MACDIndicator(fast=12, slow=26, signal=9),
+        OBVIndicator()
+    ]
+
+def score_symbol(symbol: str, asset_type: str, df: pd.DataFrame) -> Dict:
+    config = get_default_config(asset_type)
+    generator = DynamicSignalGenerator(config, live=True, tail=1)
+    latest = generator.generate_signals(MarketData(df), build_indicators(config[asset_type]['rsi_buy'], config[asset_type]['rsi_sell']), symbol, asset_type).iloc[-1]
+    return {
+        'Ticker': symbol,
+        'Asset_Type': asset_type,
+        'Signal': int(latest['Signal']),
+        'Confidence': float(latest['Confidence']),
+        'Close': float(latest['Close']),
+        'Exit_Price': latest['Exit_Price'],
+        'RSI': float(latest['RSI'])
+    }
+
+def fetch_universe(universe: List[Tuple[str, str]], period: Optional[str], interval: Optional[str]) -> Tuple[Dict[Tuple[str, str], pd.DataFrame], Dict[str, str]]:
+    frames: Dict[Tuple[str, str], pd.DataFrame] = {}
+    errors: Dict[str, str] = {}
+    yahoo_groups: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+    crypto: List[Tuple[str, str, str, str]] = []
+
+    for symbol, asset_type in universe:
+        config = get_default_config(asset_type).get(asset_type)
+        if config is None:
+            errors[symbol] = f"Unsupported asset type: {asset_type}"
+            continue
+        selected_period = period or config['period']
+        selected_interval = interval or config['interval']
+        if not validate_period_interval(selected_period, selected_interval):
+            errors[symbol] = f"Invalid period ({selected_period}) for interval ({selected_interval})"
+        elif asset_type == 'crypto':
+            crypto.append((symbol, asset_type, selected_period, selected_interval))
+        else:
+            yahoo_groups.setdefault((selected_period, selected_interval), []).append((symbol, asset_type))
+
+    def load_yahoo(group: Tuple[str, str], members: List[Tuple[str, str]]) -> None:
+        asset_types = dict(members)
+        provider, _ = get_data_provider(members[0][1], members[0][0])
+        batch, batch_errors = provider.fetch_many(list(asset_types), *group)
+        errors.update(batch_errors)
+        for symbol, data in batch.items():
+            frames[(symbol, asset_types[symbol])] = data.df
+
+    def load_crypto(symbol: str, asset_type: str, selected_period: str, selected_interval: str) -> None:
+        try:
+            provider, provider_symbol = get_data_provider(asset_type, symbol)
+            frames[(symbol, asset_type)] = provider.fetch_data(provider_symbol, selected_period, selected_interval, asset_type).df
+        except Exception as e:
+            errors[symbol] = str(e)
+
+    with ThreadPoolExecutor(max_workers=scan_yahoo_concurrency) as yahoo_pool, ThreadPoolExecutor(max_workers=scan_binance_concurrency) as binance_pool:
+        jobs = []
+        for group, members in yahoo_groups.items():
+            for start in range(0, len(members), scan_yahoo_batch_size):
+                jobs.append(yahoo_pool.submit(load_yahoo, group, members[start:start + scan_yahoo_batch_size]))
+        jobs += [binance_pool.submit(load_crypto, *item) for item in crypto]
+        for job in jobs:
+            job.result()
+    return frames, errors
+
+def scan_universe(universe: List[Tuple[str, str]], period: Optional[str] = None, interval: Optional[str] = None) -> Tuple[pd.DataFrame, Dict[str, str]]:
+    frames, errors = fetch_universe(universe, period, interval)
+    warmup = max(indicator.lookback for indicator in build_indicators(0, 100)) + 2
+    pool = get_process_pool()
+    futures = {
+        key: pool.submit(score_symbol, key[0], key[1], df.iloc[-warmup:])
+        for key, df in frames.items()
+    }
+    rows = []
+    for (symbol, _), future in futures.items():
+        try:
+            rows.append(future.result())
+        except Exception as e:
+            errors[symbol] = str(e)
+    table = pd.DataFrame(rows, columns=['Ticker', 'Asset_Type', 'Signal', 'Confidence', 'Close', 'Exit_Price', 'RSI'])
+    table = table.sort_values('Confidence', ascending=False, kind='stable').reset_index(drop=True)
+    return table, errors
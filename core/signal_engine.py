@@ -1,193 +1,450 @@
 from abc import ABC, abstractmethod
 import pandas as pd
 import numpy as np
-import yfinance as yf
 from dataclasses import dataclass
-from typing import List, Dict
-import ccxt
+from typing import Callable, List, Dict, Optional, Tuple
+import threading
+import time
+from core.exchange_pool import binance_pool
+from core.pagination import fetch_ohlcv_paginated
+from core.indicator_engine import IndicatorInputs, compute_indicators, rolling_mean, ewm_mean
+from core.metrics import fetch_seconds, upstream_requests, upstream_errors, indicator_seconds, scoring_seconds
+
+INTERVAL_MS = {
+    '1m': 60 * 1000,
+    '5m': 5 * 60 * 1000,
+    '15m': 15 * 60 * 1000,
+    '30m': 30 * 60 * 1000,
+    '1h': 60 * 60 * 1000,
+    '1d': 24 * 60 * 60 * 1000
+}
+
+PERIOD_MS = {
+    '1mo': 30 * 24 * 60 * 60 * 1000,
+    '1y': 365 * 24 * 60 * 60 * 1000,
+    '6mo': 180 * 24 * 60 * 60 * 1000,
+    '30d': 30 * 24 * 60 * 60 * 1000,
+    '14d': 14 * 24 * 60 * 60 * 1000,
+    '7d': 7 * 24 * 60 * 60 * 1000
+}
+
+VALID_PERIODS = {
+    "1m": ["7d", "14d", "30d"],
+    "5m": ["7d", "14d", "30d"],
+    "15m": ["7d", "14d", "30d"],
+    "30m": ["7d", "14d", "30d"],
+    "1h": ["14d", "30d", "6mo"],
+    "1d": ["30d", "6mo", "1y"]
+}
+
+def max_period_ms(interval: str) -> int:
+    periods = VALID_PERIODS.get(interval)
+    return max(PERIOD_MS[period] for period in periods) if periods else max(PERIOD_MS.values())
+
+EWM_WARMUP_SPANS = 10
 
 @dataclass
 class MarketData:
     df: pd.DataFrame
 
+    def inputs(self) -> IndicatorInputs:
+        return IndicatorInputs.from_frame(self.df)
+
+    def tail(self, n: int) -> "MarketData":
+        return MarketData(self.df.iloc[-n:])
+
+class CompactMarketData:
+    __slots__ = ('timestamps', 'values', 'tz', 'index_name')
+    columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+    def __init__(self, timestamps: np.ndarray, values: np.ndarray, tz: Optional[str] = None, index_name: Optional[str] = None):
+        self.timestamps = timestamps
+        self.values = values
+        self.tz = tz
+        self.index_name = index_name
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "CompactMarketData":
+        index = df.index.tz_convert('UTC') if df.index.tz is not None else df.index
+        values = np.empty((len(cls.columns), len(df)), dtype=np.float32)
+        for row, column in enumerate(cls.columns):
+            values[row] = df[column].to_numpy()
+        tz = str(df.index.tz) if df.index.tz is not None else None
+        return cls(index.as_unit('ms').asi8.copy(), values, tz, df.index.name)
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self.to_frame()
+
+    @property
+    def nbytes(self) -> int:
+        return self.timestamps.nbytes + self.values.nbytes
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def to_frame(self) -> pd.DataFrame:
+        index = pd.DatetimeIndex(self.timestamps.view('datetime64[ms]'), name=self.index_name)
+        if self.tz is not None:
+            index = index.tz_localize('UTC').tz_convert(self.tz)
+        return pd.DataFrame(self.values.T, index=index, columns=self.columns, copy=False)
+
+    def inputs(self) -> IndicatorInputs:
+        return IndicatorInputs(self.values[3].astype(np.float64), self.values[4].astype(np.float64))
+
+    def tail(self, n: int) -> "CompactMarketData":
+        return CompactMarketData(self.timestamps[-n:], self.values[:, -n:], self.tz, self.index_name)
+
 class DataProvider(ABC):
     @abstractmethod
     def fetch_data(self, symbol: str, period: str, interval: str, asset_type: str) -> MarketData:
         pass
 
 class Indicator(ABC):
+    columns: List[str] = []
+    lookback = 0
+
     @abstractmethod
-    def calculate(self, data: MarketData) -> pd.DataFrame:
+    def compute(self, inputs: IndicatorInputs, out: np.ndarray) -> None:
         pass
 
+    def calculate(self, data: MarketData) -> pd.DataFrame:
+        names, block = compute_indicators(data.inputs(), [self])
+        return data.df.assign(**{name: block[:, i] for i, name in enumerate(names) if name in self.columns})
+
 class SignalGenerator(ABC):
     @abstractmethod
     def generate_signals(self, data: MarketData, indicators: List[Indicator], symbol: str, asset_type: str) -> pd.DataFrame:
         pass
 
-class YahooFinanceDataProvider(DataProvider):
+class IncrementalDataProvider(DataProvider):
+    def __init__(self, incremental: bool = True, store=None, frames=None):
+        self.incremental = incremental
+        self.store = store
+        if frames is None:
+            # core.cache imports this module, so the default cache is built here rather than at import.
+            from core.cache import OHLCVCache
+            frames = OHLCVCache(max_bytes=float('inf'))
+        # (frame, span) per symbol and interval, held for incremental fetches under the cache's byte budget.
+        self.frames = frames
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def download(self, symbol: str, period: str, interval: str, since: Optional[pd.Timestamp]) -> pd.DataFrame:
+        pass
+
     def fetch_data(self, symbol: str, period: str, interval: str, asset_type: str) -> MarketData:
         try:
-            print(f"Fetching data for {symbol}, period: {period}, interval: {interval}, asset_type: {asset_type}")
-            df = yf.download(symbol, period=period, interval=interval, auto_adjust=False)
-            if df is None or df.empty or not isinstance(df, pd.DataFrame):
-                print(f"No data fetched for {symbol}. Raw download result: {df}")
+            span = PERIOD_MS.get(period, PERIOD_MS['30d'])
+            key = (symbol, interval)
+            held, held_span = self.held(key)
+            if held is None and self.store is not None:
+                try:
+                    held, held_span = self.load_stored(symbol, interval)
+                except Exception as e:
+                    # The store is only a cache: a damaged partition means a full download, not a failed request.
+                    print(f"Failed to load stored candles for {symbol} {interval}: {str(e)}")
+                    held, held_span = None, 0
+            covered_from = None
+            if self.incremental and held is not None and held_span >= span and not is_stale(held, span):
+                fresh = self.timed_download(symbol, period, interval, held.index[-1])
+                df = merge_frames(held, fresh)
+            else:
+                held_span = 0
+                covered_from = int(time.time() * 1000) - span
+                df = self.timed_download(symbol, period, interval, None)
+            if df is None or df.empty:
                 raise ValueError(f"No data fetched for {symbol}. Period: {period}, Interval: {interval}")
-            print(f"Raw data columns: {df.columns}, shape: {df.shape}")
-            required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = df.columns.get_level_values(0) 
-            if not all(col in df.columns for col in required_cols):
-                print(f"Missing columns: {set(required_cols) - set(df.columns)}")
-                raise ValueError(f"Missing required columns for {symbol}. Columns: {df.columns}")
-            print(f"Data after fetch: {df.head()}")
-            return MarketData(df)
+            if self.incremental:
+                self.remember(key, df, max(span, held_span))
+            if self.store is not None:
+                try:
+                    self.store.append(symbol, interval, df, covered_from)
+                except Exception as e:
+                    print(f"Failed to store candles for {symbol} {interval}: {str(e)}")
+            return MarketData(trim_frame(df, span))
         except Exception as e:
+            upstream_errors.inc(provider=type(self).__name__)
             print(f"Exception in fetch_data: {str(e)}")
             raise RuntimeError(f"Failed to fetch data for {symbol}: {str(e)}")
 
-class BinanceDataProvider(DataProvider):
-    def fetch_data(self, symbol: str, period: str, interval: str, asset_type: str) -> MarketData:
-        try:
-            exchange = ccxt.binance()
-            timeframe = interval
-            period_map = {
-                '1mo': 30 * 24 * 60 * 60 * 1000,
-                '1y': 365 * 24 * 60 * 60 * 1000,
-                '6mo': 180 * 24 * 60 * 60 * 1000,
-                '30d': 30 * 24 * 60 * 60 * 1000,
-                '14d': 14 * 24 * 60 * 60 * 1000,
-                '7d': 7 * 24 * 60 * 60 * 1000
-            }
-            since = exchange.milliseconds() - period_map.get(period, 30 * 24 * 60 * 60 * 1000)
-            ohlcv = exchange.fetch_ohlcv(symbol, timeframe, since)
-            if ohlcv is None or not ohlcv:
-                raise ValueError(f"No data fetched for {symbol}")
-            df = pd.DataFrame(ohlcv, columns=['Timestamp', 'Open', 'High', 'Low', 'Close', 'Volume'])
-            df['Timestamp'] = pd.to_datetime(df['Timestamp'], unit='ms')
-            df.set_index('Timestamp', inplace=True)
-            if df.empty:
-                raise ValueError(f"No data fetched for {symbol}")
-            return MarketData(df)
-        except Exception as e:
-            raise RuntimeError(f"Failed to fetch data for {symbol}: {str(e)}")
+    def timed_download(self, symbol: str, period: str, interval: str, since: Optional[pd.Timestamp]) -> pd.DataFrame:
+        provider = type(self).__name__
+        upstream_requests.inc(provider=provider)
+        with fetch_seconds.time(provider=provider, interval=interval):
+            return self.download(symbol, period, interval, since)
+
+    def load_stored(self, symbol: str, interval: str) -> Tuple[Optional[pd.DataFrame], int]:
+        covered_from = self.store.coverage(symbol, interval)
+        if covered_from is None:
+            return None, 0
+        now = int(time.time() * 1000)
+        # Never reload more than the longest period this interval can be asked for.
+        since_ms = max(covered_from, now - max_period_ms(interval))
+        held = self.store.load(symbol, interval, since_ms=since_ms)
+        if held is None:
+            return None, 0
+        return held, now - since_ms
+
+    def held(self, key: Tuple[str, str]) -> Tuple[Optional[pd.DataFrame], int]:
+        entry = self.frames.get((type(self).__name__,) + key)
+        return entry if entry is not None else (None, 0)
+
+    def remember(self, key: Tuple[str, str], df: pd.DataFrame, span: int) -> None:
+        with self._lock:
+            if self.held(key)[1] <= span:
+                self.frames.put((type(self).__name__,) + key, (trim_frame(df, span), span), float('inf'))
+
+def to_epoch_ms(ts: pd.Timestamp) -> int:
+    return int(ts.timestamp() * 1000)
+
+def is_stale(df: pd.DataFrame, span: int) -> bool:
+    return to_epoch_ms(df.index[-1]) < time.time() * 1000 - span
+
+def merge_frames(held: pd.DataFrame, fresh: Optional[pd.DataFrame]) -> pd.DataFrame:
+    if fresh is None or fresh.empty:
+        return held
+    df = pd.concat([held, fresh[held.columns]])
+    df = df[~df.index.duplicated(keep='last')]
+    return df.sort_index()
+
+def trim_frame(df: pd.DataFrame, span: int) -> pd.DataFrame:
+    cutoff = df.index[-1] - pd.Timedelta(milliseconds=span)
+    if df.index[0] >= cutoff:
+        return df
+    return df[df.index >= cutoff]
+
+class YahooFinanceDataProvider(IncrementalDataProvider):
+    def download(self, symbol: str, period: str, interval: str, since: Optional[pd.Timestamp]) -> pd.DataFrame:
+        import yfinance as yf
+        print(f"Fetching data for {symbol}, period: {period}, interval: {interval}, since: {since}")
+        if since is None:
+            df = yf.download(symbol, period=period, interval=interval, auto_adjust=False)
+        else:
+            df = yf.download(symbol, start=since, interval=interval, auto_adjust=False)
+        if df is None or not isinstance(df, pd.DataFrame):
+            print(f"No data fetched for {symbol}. Raw download result: {df}")
+            raise ValueError(f"No data fetched for {symbol}. Period: {period}, Interval: {interval}")
+        if df.empty:
+            return df
+        print(f"Raw data columns: {df.columns}, shape: {df.shape}")
+        required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
+        if isinstance(df.columns, pd.MultiIndex):
+            df.columns = df.columns.get_level_values(0)
+        if not all(col in df.columns for col in required_cols):
+            print(f"Missing columns: {set(required_cols) - set(df.columns)}")
+            raise ValueError(f"Missing required columns for {symbol}. Columns: {df.columns}")
+        if since is not None:
+            df = df[df.index >= since]
+        return df
+
+    def fetch_many(self, symbols: List[str], period: str, interval: str, chunk_size: int = 50) -> Tuple[Dict[str, MarketData], Dict[str, str]]:
+        import yfinance as yf
+        span = PERIOD_MS.get(period, PERIOD_MS['30d'])
+        results: Dict[str, MarketData] = {}
+        errors: Dict[str, str] = {}
+        for start in range(0, len(symbols), chunk_size):
+            chunk = symbols[start:start + chunk_size]
+            print(f"Fetching batch of {len(chunk)} symbols, period: {period}, interval: {interval}")
+            upstream_requests.inc(provider=type(self).__name__)
+            try:
+                with fetch_seconds.time(provider=type(self).__name__, interval=interval):
+                    wide = yf.download(chunk, period=period, interval=interval, group_by='ticker', auto_adjust=False, progress=False, multi_level_index=True)
+            except Exception as e:
+                upstream_errors.inc(provider=type(self).__name__)
+                errors.update({symbol: f"Failed to fetch data for {symbol}: {str(e)}" for symbol in chunk})
+                continue
+            for symbol in chunk:
+                df = split_ticker_frame(wide, symbol)
+                if df is None:
+                    errors[symbol] = f"No data fetched for {symbol}. Period: {period}, Interval: {interval}"
+                    continue
+                if self.incremental:
+                    # Held across requests, so it must not keep the whole batch block alive.
+                    self.remember((symbol, interval), df.copy(), span)
+                results[symbol] = MarketData(trim_frame(df, span))
+        return results, errors
+
+def split_ticker_frame(wide: Optional[pd.DataFrame], symbol: str) -> Optional[pd.DataFrame]:
+    if wide is None or wide.empty or not isinstance(wide.columns, pd.MultiIndex):
+        return None
+    if symbol not in wide.columns.get_level_values(0):
+        return None
+    df = wide[symbol]
+    if not all(col in df.columns for col in ['Open', 'High', 'Low', 'Close', 'Volume']):
+        return None
+    # Other tickers' timestamps leave all-NaN rows; only copy when there are some to drop.
+    present = df.notna().any(axis=1).to_numpy()
+    if not present.any():
+        return None
+    return df if present.all() else df[present]
+
+class BinanceDataProvider(IncrementalDataProvider):
+    def __init__(self, incremental: bool = True, exchange_factory: Callable = binance_pool.get, page_limit: int = 1000, max_concurrency: int = 4, store=None, frames=None):
+        super().__init__(incremental, store, frames)
+        self.exchange_factory = exchange_factory
+        self.page_limit = page_limit
+        self.max_concurrency = max_concurrency
+
+    def download(self, symbol: str, period: str, interval: str, since: Optional[pd.Timestamp]) -> pd.DataFrame:
+        exchange = self.exchange_factory()
+        timeframe = interval
+        if since is None:
+            since_ms = exchange.milliseconds() - PERIOD_MS.get(period, PERIOD_MS['30d'])
+        else:
+            since_ms = to_epoch_ms(since)
+        timestamps, values = fetch_ohlcv_paginated(exchange, symbol, timeframe, since_ms, limit=self.page_limit, max_concurrency=self.max_concurrency)
+        index = pd.to_datetime(timestamps, unit='ms')
+        index.name = 'Timestamp'
+        return pd.DataFrame(values, index=index, columns=['Open', 'High', 'Low', 'Close', 'Volume'])
 
 class RSIIndicator(Indicator):
+    columns = ['RSI']
+
     def __init__(self, period: int, buy_threshold: float, sell_threshold: float):
         self.period = period
         self.buy_threshold = buy_threshold
         self.sell_threshold = sell_threshold
 
-    def calculate(self, data: MarketData) -> pd.DataFrame:
-        df = data.df.copy()
-        close = df['Close']
-        delta = close.diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        avg_gain = gain.rolling(window=self.period).mean()
-        avg_loss = loss.rolling(window=self.period).mean()
-        rs = avg_gain / avg_loss
-        df['RSI'] = 100 - (100 / (1 + rs))
-        return df
+    @property
+    def lookback(self) -> int:
+        return self.period + 1
+
+    def compute(self, inputs: IndicatorInputs, out: np.ndarray) -> None:
+        delta = inputs.delta
+        avg_gain = rolling_mean(np.where(delta > 0, delta, 0.0), self.period, np.empty(len(delta)))
+        avg_loss = rolling_mean(np.where(delta < 0, -delta, 0.0), self.period, np.empty(len(delta)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out[:, 0] = 100 - (100 / (1 + avg_gain / avg_loss))
 
 class MACDIndicator(Indicator):
+    columns = ['MACD', 'MACD_Signal']
+
     def __init__(self, fast: int, slow: int, signal: int):
         self.fast = fast
         self.slow = slow
         self.signal = signal
 
-    def calculate(self, data: MarketData) -> pd.DataFrame:
-        df = data.df.copy()
-        close = df['Close']
-        ema_fast = close.ewm(span=self.fast, adjust=False).mean()
-        ema_slow = close.ewm(span=self.slow, adjust=False).mean()
-        df['MACD'] = ema_fast - ema_slow
-        df['MACD_Signal'] = df['MACD'].ewm(span=self.signal, adjust=False).mean()
-        return df
+    @property
+    def lookback(self) -> int:
+        # EWMs never fully forget; after this many spans the dropped history weighs < 1e-10.
+        return EWM_WARMUP_SPANS * (self.slow + self.signal)
+
+    def compute(self, inputs: IndicatorInputs, out: np.ndarray) -> None:
+        ema_slow = ewm_mean(inputs.close, self.slow, np.empty(len(inputs.close)))
+        ewm_mean(inputs.close, self.fast, out[:, 0])
+        out[:, 0] -= ema_slow
+        ewm_mean(out[:, 0], self.signal, out[:, 1])
 
 class OBVIndicator(Indicator):
-    def calculate(self, data: MarketData) -> pd.DataFrame:
-        df = data.df.copy()
-        close = df['Close']
-        volume = df['Volume']
-        direction = np.sign(close.diff())
-        df['OBV'] = (volume * direction).cumsum()
-        return df
+    columns = ['OBV']
+    lookback = 2
+
+    def compute(self, inputs: IndicatorInputs, out: np.ndarray) -> None:
+        flow = inputs.volume * np.sign(inputs.delta)
+        np.nancumsum(flow, out=out[:, 0])
+        out[np.isnan(flow), 0] = np.nan
+
+def exit_prices(signal: np.ndarray, rsi: np.ndarray, close: np.ndarray, rsi_buy: float, rsi_sell: float) -> np.ndarray:
+    prices = np.full(len(signal), None, dtype=object)
+    for entries, exits in ((signal == 1, rsi > rsi_sell), (signal == -1, rsi < rsi_buy)):
+        rows = np.flatnonzero(entries)
+        crossings = np.flatnonzero(exits)
+        nearest = np.searchsorted(crossings, rows)
+        found = nearest < len(crossings)
+        prices[rows[found]] = close[crossings[nearest[found]]]
+    return prices
+
+def score_signals(rsi: np.ndarray, rsi_buy_flag: np.ndarray, rsi_sell_flag: np.ndarray, macd_cross: np.ndarray, macd_cross_sell: np.ndarray, obv_trend: np.ndarray, rsi_buy: float, rsi_sell: float, obv_falling: Optional[np.ndarray] = None, votes: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+    buy_score = rsi_buy_flag.astype(np.int8) + macd_cross + obv_trend
+    sell_score = rsi_sell_flag.astype(np.int8) + macd_cross_sell + (~obv_trend if obv_falling is None else obv_falling)
+
+    no_signal_mask = (buy_score < 2) & (sell_score < 2)
+    buy_score |= no_signal_mask & rsi_buy_flag
+    sell_score |= no_signal_mask & rsi_sell_flag
+    buy_mask = buy_score >= 1
+    sell_mask = sell_score >= 1
+
+    signal = np.where(sell_mask, -1, np.where(buy_mask, 1, 0)).astype(np.int64)
+
+    buy_confidence = (buy_score / votes) * (0.5 + 0.5 * (np.clip(rsi_buy - rsi, 0, None) / rsi_buy))
+    sell_confidence = (sell_score / votes) * (0.5 + 0.5 * (np.clip(rsi - rsi_sell, 0, None) / (100 - rsi_sell)))
+    confidence = np.where(sell_mask, sell_confidence, np.where(buy_mask, buy_confidence, 0.0))
+    return signal, np.clip(confidence, 0, 1)
 
 class DynamicSignalGenerator(SignalGenerator):
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, live: bool = False, tail: Optional[int] = 10):
+        if live and not tail:
+            raise ValueError("Live mode needs a tail length")
         self.config = config
+        self.live = live
+        self.tail = tail
 
     def generate_signals(self, data: MarketData, indicators: List[Indicator], symbol: str, asset_type: str) -> pd.DataFrame:
-        df = data.df.copy()
-        for indicator in indicators:
-            df = indicator.calculate(MarketData(df))
-
-        df = df.dropna()
-        if len(df) < 10: 
-            raise ValueError(f"Insufficient data after dropping NaNs for {symbol}. Only {len(df)} rows available.")
-
-        df['Signal'] = 0
-        df['Confidence'] = 0.0
+        if self.live:
+            warmup = max((indicator.lookback for indicator in indicators), default=0)
+            data = data.tail(warmup + self.tail + 1)
+        mode = 'live' if self.live else 'full'
+        df = data.df
+        started = time.perf_counter()
+        names, block = compute_indicators(data.inputs(), indicators)
+        indicator_seconds.observe(time.perf_counter() - started, mode=mode)
+        started = time.perf_counter()
+        rows = np.flatnonzero(~np.isnan(block).any(axis=1) & df.notna().all(axis=1).to_numpy())
+        if len(rows) < 10: 
+            raise ValueError(f"Insufficient data after dropping NaNs for {symbol}. Only {len(rows)} rows available.")
+        if self.live:
+            rows = rows[-(self.tail + 1):]
+        if rows[-1] - rows[0] + 1 == len(rows):
+            rows = slice(rows[0], rows[-1] + 1)
+        df = pd.DataFrame(block[rows], index=df.index[rows], columns=names)
 
         rsi_buy = self.config[asset_type]['rsi_buy']
         rsi_sell = self.config[asset_type]['rsi_sell']
 
-        df['MACD_Cross'] = ((df['MACD'] > df['MACD_Signal']) & 
-                           (df['MACD'].shift(1) <= df['MACD_Signal'].shift(1)))
-        df['MACD_Cross_Sell'] = ((df['MACD'] < df['MACD_Signal']) & 
-                                (df['MACD'].shift(1) >= df['MACD_Signal'].shift(1)))
-        df['OBV_Trend'] = df['OBV'].diff() > 0
-        df['RSI_Buy'] = df['RSI'].lt(rsi_buy)  
-        df['RSI_Sell'] = df['RSI'].gt(rsi_sell)
+        # An indicator left out of the set casts no vote on either side.
+        votes = 0
+        obv_falling = None
+        if 'MACD' in df:
+            votes += 1
+            df['MACD_Cross'] = ((df['MACD'] > df['MACD_Signal']) & 
+                               (df['MACD'].shift(1) <= df['MACD_Signal'].shift(1)))
+            df['MACD_Cross_Sell'] = ((df['MACD'] < df['MACD_Signal']) & 
+                                    (df['MACD'].shift(1) >= df['MACD_Signal'].shift(1)))
+        else:
+            df['MACD_Cross'] = df['MACD_Cross_Sell'] = False
+        if 'OBV' in df:
+            votes += 1
+            df['OBV_Trend'] = df['OBV'].diff() > 0
+        else:
+            df['OBV_Trend'] = False
+            obv_falling = np.zeros(len(df), dtype=bool)
+        if 'RSI' in df:
+            votes += 1
+            df['RSI_Buy'] = df['RSI'].lt(rsi_buy)  
+            df['RSI_Sell'] = df['RSI'].gt(rsi_sell)
+            rsi = df['RSI'].to_numpy()
+        else:
+            df['RSI_Buy'] = df['RSI_Sell'] = False
+            # A neutral reading leaves confidence to the vote count and never triggers an RSI exit.
+            rsi = np.full(len(df), (rsi_buy + rsi_sell) / 2)
+        if not votes:
+            raise ValueError(f"No RSI, MACD or OBV indicator given for {symbol}")
 
         for col in ['MACD_Cross', 'MACD_Cross_Sell', 'OBV_Trend', 'RSI_Buy', 'RSI_Sell']:
             if df[col].isna().any():
                 raise ValueError(f"NaN values found in {col} after computation for {symbol}")
 
-        df['Buy_Score'] = (df['RSI_Buy'].astype(int) + 
-                          df['MACD_Cross'].astype(int) + 
-                          df['OBV_Trend'].astype(int))
-        df['Sell_Score'] = (df['RSI_Sell'].astype(int) + 
-                           df['MACD_Cross_Sell'].astype(int) + 
-                           (~df['OBV_Trend']).astype(int))
-
-        buy_mask = df['Buy_Score'] >= 2
-        sell_mask = df['Sell_Score'] >= 2
-
-        no_signal_mask = (~buy_mask) & (~sell_mask)
-        df.loc[no_signal_mask & df['RSI_Buy'], 'Buy_Score'] = 1
-        df.loc[no_signal_mask & df['RSI_Sell'], 'Sell_Score'] = 1
-        buy_mask = df['Buy_Score'] >= 1
-        sell_mask = df['Sell_Score'] >= 1
-
-        df.loc[buy_mask, 'Signal'] = 1
-        df.loc[sell_mask, 'Signal'] = -1
-
-        epsilon = 1e-10
-        df.loc[buy_mask, 'Confidence'] = (
-            (df['Buy_Score'] / 3) *  
-            (0.5 + 0.5 * ((rsi_buy - df['RSI']).clip(lower=0) / rsi_buy)) 
-        )
-        df.loc[sell_mask, 'Confidence'] = (
-            (df['Sell_Score'] / 3) *  
-            (0.5 + 0.5 * ((df['RSI'] - rsi_sell).clip(lower=0) / (100 - rsi_sell)))  
+        df['Signal'], df['Confidence'] = score_signals(
+            rsi, df['RSI_Buy'].to_numpy(), df['RSI_Sell'].to_numpy(),
+            df['MACD_Cross'].to_numpy(), df['MACD_Cross_Sell'].to_numpy(), df['OBV_Trend'].to_numpy(),
+            rsi_buy, rsi_sell, obv_falling, votes
         )
-
-        df['Confidence'] = df['Confidence'].clip(0, 1)
         df['Ticker'] = symbol
 
-        df['Exit_Price'] = None
-        for idx in df.index:
-            if df.loc[idx, 'Signal'] == 1: 
-                future_rows = df.loc[idx:].index
-                exit_idx = future_rows[df.loc[future_rows, 'RSI'] > rsi_sell][:1]
-                if not exit_idx.empty:
-                    df.loc[idx, 'Exit_Price'] = df.loc[exit_idx[0], 'Close']
-            elif df.loc[idx, 'Signal'] == -1: 
-                future_rows = df.loc[idx:].index
-                exit_idx = future_rows[df.loc[future_rows, 'RSI'] < rsi_buy][:1]
-                if not exit_idx.empty:
-                    df.loc[idx, 'Exit_Price'] = df.loc[exit_idx[0], 'Close']
-
-        return df[['Signal', 'Confidence', 'Ticker', 'RSI', 'MACD', 'MACD_Signal', 'OBV', 'Close', 'Exit_Price']].iloc[-10:]
\ No newline at end of file
+        df['Exit_Price'] = exit_prices(df['Signal'].to_numpy(), rsi, df['Close'].to_numpy(), rsi_buy, rsi_sell)
+
+        columns = ['Signal', 'Confidence', 'Ticker', 'RSI', 'MACD', 'MACD_Signal', 'OBV', 'Close', 'Exit_Price']
+        result = df[[column for column in columns if column in df]]
+        scoring_seconds.observe(time.perf_counter() - started, mode=mode)
+        return result.iloc[-self.tail:] if self.tail else result
\ No newline at end of file
@@ -0,0 +1,148 @@
+import math
+import numpy as np
+import pandas as pd
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, List, Optional
+from core.signal_engine import score_signals
+
+class StreamingIndicator(ABC):
+    columns: List[str] = []
+
+    @abstractmethod
+    def update(self, close: float, volume: float) -> Dict[str, float]:
+        pass
+
+    @abstractmethod
+    def flags(self) -> Dict[str, bool]:
+        pass
+
+    def update_many(self, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+        out = np.empty((len(close), len(self.columns)))
+        for i in range(len(close)):
+            values = self.update(float(close[i]), float(volume[i]))
+            out[i] = [values[column] for column in self.columns]
+        return out
+
+class StreamingRSI(StreamingIndicator):
+    columns = ['RSI']
+
+    def __init__(self, period: int, buy_threshold: float, sell_threshold: float):
+        self.period = period
+        self.buy_threshold = buy_threshold
+        self.sell_threshold = sell_threshold
+        self._gains: deque = deque(maxlen=period)
+        self._losses: deque = deque(maxlen=period)
+        self._prev_close: Optional[float] = None
+        self.value = math.nan
+
+    def update(self, close: float, volume: float = 0.0) -> Dict[str, float]:
+        delta = 0.0 if self._prev_close is None else close - self._prev_close
+        self._prev_close = close
+        self._gains.append(max(delta, 0.0))
+        self._losses.append(max(-delta, 0.0))
+        if len(self._gains) < self.period:
+            self.value = math.nan
+            return {'RSI': self.value}
+        # Summing the fixed-size window keeps the state O(period) without running-sum drift.
+        gain_sum, loss_sum = sum(self._gains), sum(self._losses)
+        if loss_sum == 0:
+            self.value = 100.0 if gain_sum > 0 else math.nan
+        else:
+            self.value = 100 - 100 / (1 + gain_sum / loss_sum)
+        return {'RSI': self.value}
+
+    def flags(self) -> Dict[str, bool]:
+        return {'RSI_Buy': self.value < self.buy_threshold, 'RSI_Sell': self.value > self.sell_threshold}
+
+class StreamingMACD(StreamingIndicator):
+    columns = ['MACD', 'MACD_Signal']
+
+    def __init__(self, fast: int, slow: int, signal: int):
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        self._ema_fast: Optional[float] = None
+        self._ema_slow: Optional[float] = None
+        self.macd = math.nan
+        self.macd_signal = math.nan
+        self._prev_macd = math.nan
+        self._prev_signal = math.nan
+
+    @staticmethod
+    def _ewm(prev: Optional[float], value: float, span: int) -> float:
+        if prev is None:
+            return value
+        alpha = 2 / (span + 1)
+        return (1 - alpha) * prev + alpha * value
+
+    def update(self, close: float, volume: float = 0.0) -> Dict[str, float]:
+        self._prev_macd, self._prev_signal = self.macd, self.macd_signal
+        self._ema_fast = self._ewm(self._ema_fast, close, self.fast)
+        self._ema_slow = self._ewm(self._ema_slow, close, self.slow)
+        self.macd = self._ema_fast - self._ema_slow
+        self.macd_signal = self._ewm(None if math.isnan(self._prev_signal) else self._prev_signal, self.macd, self.signal)
+        return {'MACD': self.macd, 'MACD_Signal': self.macd_signal}
+
+    def flags(self) -> Dict[str, bool]:
+        return {
+            'MACD_Cross': self.macd > self.macd_signal and self._prev_macd <= self._prev_signal,
+            'MACD_Cross_Sell': self.macd < self.macd_signal and self._prev_macd >= self._prev_signal
+        }
+
+class StreamingOBV(StreamingIndicator):
+    columns = ['OBV']
+
+    def __init__(self):
+        self._prev_close: Optional[float] = None
+        self._total = 0.0
+        self.value = math.nan
+        self._prev_value = math.nan
+
+    def update(self, close: float, volume: float) -> Dict[str, float]:
+        self._prev_value = self.value
+        if self._prev_close is None:
+            self.value = math.nan
+        else:
+            self._total += volume * np.sign(close - self._prev_close)
+            self.value = self._total
+        self._prev_close = close
+        return {'OBV': self.value}
+
+    def flags(self) -> Dict[str, bool]:
+        return {'OBV_Trend': self.value - self._prev_value > 0}
+
+class StreamingSignalEngine:
+    def __init__(self, rsi_period: int = 14, rsi_buy: float = 30, rsi_sell: float = 70, macd_fast: int = 12, macd_slow: int = 26, macd_signal: int = 9):
+        self.rsi_buy = rsi_buy
+        self.rsi_sell = rsi_sell
+        self.rsi = StreamingRSI(rsi_period, rsi_buy, rsi_sell)
+        self.macd = StreamingMACD(macd_fast, macd_slow, macd_signal)
+        self.obv = StreamingOBV()
+        self.bars = 0
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, **params) -> "StreamingSignalEngine":
+        engine = cls(**params)
+        engine.update_many(df['Close'].to_numpy(dtype=np.float64), df['Volume'].to_numpy(dtype=np.float64))
+        return engine
+
+    def update(self, close: float, volume: float) -> Dict[str, float]:
+        self.bars += 1
+        row = {'Close': close}
+        flags = {}
+        for indicator in (self.rsi, self.macd, self.obv):
+            row.update(indicator.update(close, volume))
+            flags.update(indicator.flags())
+        signal, confidence = score_signals(
+            np.array([row['RSI']]), np.array([flags['RSI_Buy']]), np.array([flags['RSI_Sell']]),
+            np.array([flags['MACD_Cross']]), np.array([flags['MACD_Cross_Sell']]), np.array([flags['OBV_Trend']]),
+            self.rsi_buy, self.rsi_sell
+        )
+        row.update(flags)
+        row['Signal'] = int(signal[0])
+        row['Confidence'] = float(confidence[0])
+        return row
+
+    def update_many(self, close: np.ndarray, volume: np.ndarray) -> List[Dict[str, float]]:
+        return [self.update(float(c), float(v)) for c, v in zip(close, volume)]
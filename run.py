@@ -1,31 +1,80 @@
+import asyncio
 import os
-import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import signal
+from telegram import Update
 from telegram.ext import ApplicationBuilder
-from core.config import tg_bot_token
+from core.config import tg_bot_token, backend_url, prewarm_enabled, preload_enabled, bot_mode, webhook_path, webhook_secret, update_concurrency, slow_update_concurrency
 from bot.register_handlers import register_handlers
+from bot.lazy import load, preload
+from core.metrics import registry
+from bot.webhook import start_web_server
+from bot.update_processor import ChatOrderedUpdateProcessor
 
-app = ApplicationBuilder().token(tg_bot_token).build()
-register_handlers(app)
+background_tasks = set()
+web_runner = None
+
+def start_background(coro) -> None:
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+async def post_init(application):
+    global web_runner
+    port = int(os.getenv("PORT", 10000))
+    if bot_mode == "webhook":
+        web_runner = await start_web_server(application, port, webhook_path, webhook_secret)
+    else:
+        web_runner = await start_web_server(application, port)
+    # Heavy modules load after the bot is answering, so /start and the menus are live from the first second.
+    start_background(start_workers(application))
 
-class HealthCheckHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        self.send_response(200)
-        self.send_header("Content-type", "text/plain")
-        self.end_headers()
-        self.wfile.write(b"Bot is running")
+async def start_workers(application):
+    if preload_enabled:
+        await preload()
+    analysis = await load("bot.handlers.analysis")
+    alerts = await load("bot.handlers.alerts")
+    send_queue, alert_scheduler = alerts.build_alerts(application.bot)
+    registry.register_stats("alert_queue", lambda: {'backlog': send_queue.backlog(), 'sent': send_queue.sent, 'failed': send_queue.failed})
+    start_background(send_queue.run())
+    start_background(alert_scheduler.run())
+    if prewarm_enabled:
+        start_background(analysis.build_prewarm_scheduler().run())
 
-def start_server(port):
-    server_address = ('0.0.0.0', port)
-    httpd = HTTPServer(server_address, HealthCheckHandler)
-    print(f"Health check server running on port {port}")
-    httpd.serve_forever()
+async def post_shutdown(application):
+    for task in list(background_tasks):
+        task.cancel()
+    if web_runner is not None:
+        await web_runner.cleanup()
+
+# Chats are handled concurrently but each chat stays in order; slow signal/scan work gets its own smaller budget.
+update_processor = ChatOrderedUpdateProcessor(update_concurrency, slow_update_concurrency)
+app = ApplicationBuilder().token(tg_bot_token).concurrent_updates(update_processor).post_init(post_init).post_shutdown(post_shutdown).build()
+register_handlers(app)
+
+async def run_webhook():
+    # Manual lifecycle: the HTTP front end and the bot share this one event loop.
+    if not backend_url:
+        raise RuntimeError("BOT_MODE=webhook needs BACKEND_URL to register the webhook")
+    await app.initialize()
+    await post_init(app)
+    await app.bot.set_webhook(url=backend_url.rstrip("/") + webhook_path, secret_token=webhook_secret, allowed_updates=Update.ALL_TYPES)
+    await app.start()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    try:
+        await stop.wait()
+    finally:
+        await app.stop()
+        await post_shutdown(app)
+        await app.shutdown()
 
 def main():
-    port = int(os.getenv("PORT", 10000))
-    server_thread = threading.Thread(target=start_server, args=(port,), daemon=True)
-    server_thread.start()
-    app.run_polling()
+    if bot_mode == "webhook":
+        asyncio.run(run_webhook())
+    else:
+        app.run_polling()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+from core.backtest import parameter_grid, sweep, GRID_COLUMNS
+from core.fake_exchange import synthetic_candles
+from core.signal_engine import MarketData, RSIIndicator, MACDIndicator, OBVIndicator, DynamicSignalGenerator
+
+def market_data(seed: int, count: int = 500) -> MarketData:
+    timestamps, values = synthetic_candles(1_700_000_000_000, count, 60 * 60 * 1000, seed=seed, volatility=0.01)
+    index = pd.to_datetime(timestamps, unit='ms')
+    return MarketData(pd.DataFrame(values, index=index, columns=['Open', 'High', 'Low', 'Close', 'Volume']))
+
+def reference_metrics(data: MarketData, rsi_period: int, rsi_buy: float, rsi_sell: float, fast: int, slow: int, signal: int) -> np.ndarray:
+    config = {'crypto': {'rsi_buy': rsi_buy, 'rsi_sell': rsi_sell}}
+    indicators = [RSIIndicator(rsi_period, rsi_buy, rsi_sell), MACDIndicator(fast, slow, signal), OBVIndicator()]
+    df = DynamicSignalGenerator(config, tail=None).generate_signals(data, indicators, 'TEST', 'crypto')
+    traded = (df['Signal'] != 0) & df['Exit_Price'].notna()
+    returns = np.where(traded, df['Signal'] * (df['Exit_Price'].astype(float) - df['Close']) / df['Close'], 0.0)
+    # Drawdown is measured from the starting equity of zero.
+    equity = np.concatenate([[0.0], np.cumsum(returns)])
+    trades = int(traded.sum())
+    return np.array([
+        trades,
+        ((returns > 0) & traded).sum() / trades,
+        returns.sum() / trades,
+        (np.maximum.accumulate(equity) - equity).max()
+    ])
+
+@pytest.mark.parametrize("seed", range(20))
+def test_sweep_matches_generate_signals(seed):
+    data = market_data(seed)
+    grid = parameter_grid(rsi_period=(9, 14), rsi_buy=(30, 40), rsi_sell=(60, 70))
+    inputs = data.inputs()
+    metrics = sweep(inputs.close, inputs.volume, grid[GRID_COLUMNS].to_numpy(dtype=np.float64), chunk_size=3)
+    for row, params in enumerate(grid[GRID_COLUMNS].itertuples(index=False)):
+        expected = reference_metrics(data, *params)
+        assert metrics[row, 0] == expected[0]
+        np.testing.assert_allclose(metrics[row, 1:], expected[1:], rtol=1e-12, atol=1e-12)
@@ -0,0 +1,25 @@
+import time
+import core.cache
+from core.cache import OHLCVCache, sizeof
+
+def test_report_dicts_are_charged_their_size():
+    report = {'direction': "Buy", 'entry_point': 101.5, 'exit_point': 104.0, 'confidence': 62.5}
+    assert sizeof(report) > 0
+    cache = OHLCVCache(max_bytes=sizeof(report) * 3)
+    for i in range(10):
+        cache.put(("AAPL", "stocks", "1d", "1y", f"type{i}"), dict(report), time.time() + 60)
+    stats = cache.stats()
+    assert stats['entries'] == 3
+    assert 0 < stats['bytes'] <= cache.max_bytes
+    assert stats['evictions'] == 7
+
+def test_put_sweeps_expired_entries_nobody_reads(monkeypatch):
+    monkeypatch.setattr(core.cache, "PURGE_INTERVAL", 0.0)
+    cache = OHLCVCache(max_bytes=1024 * 1024)
+    cache.put("stale", b"x" * 100, time.time() - 1)
+    cache.put("fresh", b"y" * 100, time.time() + 60)
+    stats = cache.stats()
+    assert stats['entries'] == 1
+    assert stats['bytes'] == 100
+    assert stats['expirations'] == 1
+    assert cache.get("fresh") == b"y" * 100
@@ -0,0 +1,91 @@
+import os
+import time
+import numpy as np
+import pandas as pd
+from core.cache import OHLCVCache, sizeof
+from core.candle_store import CandleStore, RECORD_DTYPE
+from core.fake_exchange import FakeExchange
+from core.signal_engine import BinanceDataProvider, PERIOD_MS
+
+HOUR = 60 * 60 * 1000
+
+def frame(start_ms: int, count: int, step: int = HOUR) -> pd.DataFrame:
+    index = pd.to_datetime(start_ms + np.arange(count, dtype=np.int64) * step, unit='ms')
+    return pd.DataFrame({column: np.arange(count, dtype=float) + 1 for column in ['Open', 'High', 'Low', 'Close', 'Volume']}, index=index)
+
+def partitions(store: CandleStore, symbol: str, interval: str):
+    directory = store._dir(symbol, interval)
+    return [os.path.join(directory, name) for name in store._partitions(directory)]
+
+def test_torn_append_is_ignored_and_repaired(tmp_path):
+    now = int(time.time() * 1000) // HOUR * HOUR
+    store = CandleStore(str(tmp_path))
+    store.append('BTC/USDT', '1h', frame(now - 100 * HOUR, 50), covered_from=now - 100 * HOUR)
+    with open(partitions(store, 'BTC/USDT', '1h')[-1], 'ab') as f:
+        f.write(b'\x00' * 10)
+
+    reopened = CandleStore(str(tmp_path))
+    assert len(reopened.load('BTC/USDT', '1h')) == 50
+    assert reopened.last_timestamp('BTC/USDT', '1h') == now - 51 * HOUR
+
+    reopened.append('BTC/USDT', '1h', frame(now - 51 * HOUR, 20))
+    assert all(os.path.getsize(path) % RECORD_DTYPE.itemsize == 0 for path in partitions(reopened, 'BTC/USDT', '1h'))
+    loaded = reopened.load('BTC/USDT', '1h')
+    assert len(loaded) == 69
+    assert loaded.index.is_monotonic_increasing and loaded.index.is_unique
+
+def test_gap_starts_a_new_segment(tmp_path):
+    now = int(time.time() * 1000) // HOUR * HOUR
+    store = CandleStore(str(tmp_path))
+    store.append('BTC/USDT', '1h', frame(now - 30 * 24 * HOUR, 48), covered_from=now - 30 * 24 * HOUR)
+    store.append('BTC/USDT', '1h', frame(now - 10 * HOUR, 9), covered_from=now - 10 * HOUR)
+
+    assert store.coverage('BTC/USDT', '1h') == now - 10 * HOUR
+    loaded = store.load('BTC/USDT', '1h')
+    assert len(loaded) == 9
+    assert loaded.index[0] == pd.Timestamp(now - 10 * HOUR, unit='ms')
+
+def test_store_failure_falls_back_to_download(tmp_path):
+    class BrokenStore(CandleStore):
+        def load(self, *args, **kwargs):
+            raise ValueError("corrupt partition")
+
+        def append(self, *args, **kwargs):
+            raise OSError("disk full")
+
+    store = BrokenStore(str(tmp_path))
+    CandleStore.append(store, 'BTC/USDT', '1h', frame(int(time.time() * 1000) // HOUR * HOUR - 100 * HOUR, 50), covered_from=0)
+    exchange = FakeExchange(seed=1)
+    provider = BinanceDataProvider(exchange_factory=lambda: exchange, max_concurrency=1, store=store)
+    data = provider.fetch_data('BTC/USDT', '7d', '1h', 'crypto')
+    assert len(data.df) >= 7 * 24
+
+def test_stored_span_is_capped_by_interval(tmp_path):
+    now = int(time.time() * 1000) // 60000 * 60000
+    store = CandleStore(str(tmp_path))
+    store.append('BTC/USDT', '1m', frame(now - 45 * 24 * HOUR, 45 * 24 * 60, step=60000), covered_from=now - 45 * 24 * HOUR)
+    provider = BinanceDataProvider(exchange_factory=lambda: FakeExchange(seed=1), store=store)
+
+    held, held_span = provider.load_stored('BTC/USDT', '1m')
+    assert held_span <= PERIOD_MS['30d'] + 60000
+    assert held.index[0] >= pd.Timestamp(now - PERIOD_MS['30d'] - 60000, unit='ms')
+
+def test_held_frames_stay_within_budget(tmp_path):
+    store = CandleStore(str(tmp_path))
+    exchange = FakeExchange(seed=1)
+    unbounded = BinanceDataProvider(exchange_factory=lambda: exchange, max_concurrency=1)
+    unbounded.fetch_data('BTC/USDT', '7d', '1h', 'crypto')
+    one_frame = sizeof(unbounded.held(('BTC/USDT', '1h')))
+    frames = OHLCVCache(max_bytes=int(one_frame * 2.5))
+    provider = BinanceDataProvider(exchange_factory=lambda: exchange, max_concurrency=1, store=store, frames=frames)
+
+    for symbol in ['BTC/USDT', 'ETH/USDT', 'SOL/USDT']:
+        provider.fetch_data(symbol, '7d', '1h', 'crypto')
+    assert frames.stats()['bytes'] <= frames.max_bytes
+    assert frames.stats()['evictions'] == 1
+    assert provider.held(('BTC/USDT', '1h')) == (None, 0)
+
+    # An evicted frame comes back from the candle store and tops up incrementally.
+    data = provider.fetch_data('BTC/USDT', '7d', '1h', 'crypto')
+    assert len(data.df) >= 7 * 24
+    assert provider.held(('BTC/USDT', '1h'))[0] is not None
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+from core.signal_engine import exit_prices
+
+def reference_exit_prices(signal: np.ndarray, rsi: np.ndarray, close: np.ndarray, rsi_buy: float, rsi_sell: float) -> list:
+    # The per-row df.loc loop exit_prices replaced.
+    df = pd.DataFrame({'Signal': signal, 'RSI': rsi, 'Close': close}, index=pd.date_range('2024-01-01', periods=len(signal), freq='h'))
+    df['Exit_Price'] = None
+    for idx in df.index:
+        if df.loc[idx, 'Signal'] == 1:
+            future_rows = df.loc[idx:].index
+            exit_idx = future_rows[df.loc[future_rows, 'RSI'] > rsi_sell][:1]
+            if not exit_idx.empty:
+                df.loc[idx, 'Exit_Price'] = df.loc[exit_idx[0], 'Close']
+        elif df.loc[idx, 'Signal'] == -1:
+            future_rows = df.loc[idx:].index
+            exit_idx = future_rows[df.loc[future_rows, 'RSI'] < rsi_buy][:1]
+            if not exit_idx.empty:
+                df.loc[idx, 'Exit_Price'] = df.loc[exit_idx[0], 'Close']
+    return df['Exit_Price'].tolist()
+
+def assert_same(signal, rsi, close, rsi_buy=30.0, rsi_sell=70.0):
+    expected = reference_exit_prices(signal, rsi, close, rsi_buy, rsi_sell)
+    assert exit_prices(signal, rsi, close, rsi_buy, rsi_sell).tolist() == expected
+
+@pytest.mark.parametrize("seed", range(25))
+def test_matches_loop_on_random_series(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 300))
+    assert_same(rng.integers(-1, 2, n), rng.uniform(0, 100, n), rng.uniform(1, 1000, n))
+
+def test_no_crossing_leaves_none():
+    n = 50
+    rng = np.random.default_rng(1)
+    assert_same(rng.integers(-1, 2, n), np.full(n, 50.0), rng.uniform(1, 1000, n))
+
+def test_crossing_on_last_row_and_entry_row():
+    signal = np.array([1, -1, 0, 1, -1, 1])
+    rsi = np.array([75.0, 50.0, 50.0, 50.0, 20.0, 80.0])
+    close = np.arange(1.0, 7.0)
+    assert_same(signal, rsi, close)
+    assert exit_prices(signal, rsi, close, 30.0, 70.0).tolist() == [1.0, 5.0, None, 6.0, 5.0, 6.0]
+
+def test_signal_on_last_row_without_exit():
+    assert_same(np.array([0, 0, 1]), np.array([80.0, 50.0, 50.0]), np.array([1.0, 2.0, 3.0]))
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from core.fake_exchange import FakeExchange
+from core.pagination import fetch_ohlcv_paginated
+
+NOW = 1_750_000_000_000
+MINUTE = 60 * 1000
+
+class GappyExchange(FakeExchange):
+    # Drops candles in the given [start, end) ranges, like an exchange outage.
+    def __init__(self, gaps, **kwargs):
+        super().__init__(**kwargs)
+        self.gaps = gaps
+
+    def _candles(self, symbol, timeframe):
+        timestamps, values = super()._candles(symbol, timeframe)
+        keep = np.ones(len(timestamps), dtype=bool)
+        for start, end in self.gaps:
+            keep &= (timestamps < start) | (timestamps >= end)
+        return timestamps[keep], values[keep]
+
+def expected(exchange, since, until):
+    timestamps, values = exchange._candles('BTC/USDT', '1m')
+    rows = (timestamps >= since) & (timestamps <= until)
+    return timestamps[rows], values[rows]
+
+@pytest.mark.parametrize("count", [1, 999, 1000, 1001, 2000, 4321])
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_page_boundaries(count, max_concurrency):
+    exchange = FakeExchange(seed=3, now_ms=NOW)
+    until = NOW // MINUTE * MINUTE
+    since = until - (count - 1) * MINUTE
+    timestamps, values = fetch_ohlcv_paginated(exchange, 'BTC/USDT', '1m', since, until, limit=1000, max_concurrency=max_concurrency)
+    want_ts, want_values = expected(exchange, since, until)
+    assert len(timestamps) == count
+    np.testing.assert_array_equal(timestamps, want_ts)
+    np.testing.assert_array_equal(values, want_values)
+    assert exchange.calls == -(-count // 1000)
+
+def test_unaligned_since_starts_at_next_candle():
+    exchange = FakeExchange(seed=3, now_ms=NOW)
+    until = NOW // MINUTE * MINUTE
+    since = until - 1500 * MINUTE + 17
+    timestamps, _ = fetch_ohlcv_paginated(exchange, 'BTC/USDT', '1m', since, until, limit=1000, max_concurrency=1)
+    assert timestamps[0] == until - 1499 * MINUTE
+    assert timestamps[-1] == until
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_gaps_produce_no_duplicates(max_concurrency):
+    until = NOW // MINUTE * MINUTE
+    since = until - 3999 * MINUTE
+    # One gap inside a page, one spanning a page boundary and one covering a whole page.
+    gaps = [(since + 100 * MINUTE, since + 150 * MINUTE), (since + 950 * MINUTE, since + 1100 * MINUTE), (since + 2000 * MINUTE, since + 3000 * MINUTE)]
+    exchange = GappyExchange(gaps, seed=3, now_ms=NOW)
+    timestamps, values = fetch_ohlcv_paginated(exchange, 'BTC/USDT', '1m', since, until, limit=1000, max_concurrency=max_concurrency)
+    want_ts, want_values = expected(exchange, since, until)
+    assert (np.diff(timestamps) > 0).all()
+    np.testing.assert_array_equal(timestamps, want_ts)
+    np.testing.assert_array_equal(values, want_values)
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+from core.fake_exchange import synthetic_candles
+from core.signal_engine import MarketData, RSIIndicator, MACDIndicator, OBVIndicator, DynamicSignalGenerator
+
+CONFIG = {'crypto': {'rsi_buy': 40, 'rsi_sell': 60}}
+
+def market_data(seed: int, count: int = 400) -> MarketData:
+    timestamps, values = synthetic_candles(1_700_000_000_000, count, 60 * 60 * 1000, seed=seed, volatility=0.01)
+    index = pd.to_datetime(timestamps, unit='ms')
+    return MarketData(pd.DataFrame(values, index=index, columns=['Open', 'High', 'Low', 'Close', 'Volume']))
+
+def generate(data: MarketData, indicators: list) -> pd.DataFrame:
+    return DynamicSignalGenerator(CONFIG, tail=None).generate_signals(data, indicators, 'TEST', 'crypto')
+
+@pytest.mark.parametrize("indicators, columns", [
+    ([RSIIndicator(14, 40, 60)], ['RSI']),
+    ([MACDIndicator(12, 26, 9)], ['MACD', 'MACD_Signal']),
+    ([OBVIndicator()], ['OBV'])
+])
+def test_single_indicator_sets_score(indicators, columns):
+    df = generate(market_data(1), indicators)
+    assert list(df.columns) == ['Signal', 'Confidence', 'Ticker'] + columns + ['Close', 'Exit_Price']
+    assert set(df['Signal'].unique()) <= {-1, 0, 1}
+    assert (df['Signal'] != 0).any()
+    assert df['Confidence'].between(0, 1).all()
+    assert (df.loc[df['Signal'] == 0, 'Confidence'] == 0).all()
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rsi_only_votes_on_thresholds(seed):
+    df = generate(market_data(seed), [RSIIndicator(14, 40, 60)])
+    expected = np.where(df['RSI'] > 60, -1, np.where(df['RSI'] < 40, 1, 0))
+    np.testing.assert_array_equal(df['Signal'].to_numpy(), expected)
+    # One vote out of one: an RSI signal is at least half confident.
+    assert (df.loc[df['Signal'] != 0, 'Confidence'] >= 0.5).all()
+
+@pytest.mark.parametrize("seed", range(5))
+def test_macd_only_votes_on_crosses(seed):
+    df = generate(market_data(seed), [MACDIndicator(12, 26, 9)])
+    above = df['MACD'] > df['MACD_Signal']
+    below = df['MACD'] < df['MACD_Signal']
+    crossed_up = above & (df['MACD'].shift(1) <= df['MACD_Signal'].shift(1))
+    crossed_down = below & (df['MACD'].shift(1) >= df['MACD_Signal'].shift(1))
+    expected = np.where(crossed_down, -1, np.where(crossed_up, 1, 0))
+    np.testing.assert_array_equal(df['Signal'].to_numpy(), expected)
+    # Without RSI there is no exit level to reach.
+    assert df['Exit_Price'].isna().all()
+    np.testing.assert_allclose(df.loc[df['Signal'] != 0, 'Confidence'], 0.5)
+
+def test_obv_only_follows_the_trend():
+    df = generate(market_data(2), [OBVIndicator()])
+    rising = df['OBV'].diff() > 0
+    np.testing.assert_array_equal(df['Signal'].to_numpy(), np.where(rising, 1, -1))
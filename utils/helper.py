@@ -2,26 +2,39 @@ from datetime import datetime
 import io
 import sys
 import os
+import threading
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-def plot_signals(df):
-    plt.figure(figsize=(12, 6))
-    plt.plot(df['Close'], label='Close Price')
-
-    buys = df[df['Signal'] == 1]
-    sells = df[df['Signal'] == -1]
+class SignalFigure:
+    def __init__(self):
+        self.figure, self.ax = plt.subplots(figsize=(12, 6))
+        self.close_line, = self.ax.plot([], [], label='Close Price')
+        self.buy_markers, = self.ax.plot([], [], '^', color='green', label='Buy Signal')
+        self.sell_markers, = self.ax.plot([], [], 'v', color='red', label='Sell Signal')
+        self.ax.xaxis_date()
+        self.ax.legend()
+        self.ax.grid()
+        self.lock = threading.Lock()
 
-    plt.plot(buys.index, buys['Close'], '^', color='green', label='Buy Signal')
-    plt.plot(sells.index, sells['Close'], 'v', color='red', label='Sell Signal')
+    def render(self, df) -> io.BytesIO:
+        buys = df[df['Signal'] == 1]
+        sells = df[df['Signal'] == -1]
+        with self.lock:
+            self.close_line.set_data(df.index, df['Close'])
+            self.buy_markers.set_data(buys.index, buys['Close'])
+            self.sell_markers.set_data(sells.index, sells['Close'])
+            self.ax.set_title(f"Signals for {datetime.now().strftime('%Y-%m-%d')}")
+            self.ax.relim()
+            self.ax.autoscale_view()
+            buf = io.BytesIO()
+            self.figure.savefig(buf, format='png')
+        buf.seek(0)
+        return buf
 
-    plt.title(f"Signals for {datetime.now().strftime('%Y-%m-%d')}")
-    plt.legend()
-    plt.grid()
-
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    buf.seek(0)
-    plt.close()
-    return buf
+signal_figure = SignalFigure()
 
+def plot_signals(df):
+    return signal_figure.render(df)
@@ -0,0 +1,129 @@
+import cProfile
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from typing import Any, Callable, List, Optional, Tuple
+from core.config import profile_dir, profile_sample_rate, profile_keep
+
+ProfileTag = Tuple[str, str, str, str]
+
+def sanitize(value: str) -> str:
+    return re.sub(r'[^A-Za-z0-9.=^-]', '-', value)
+
+class ProfileSession:
+    # One cProfile.Profile shared by the fetch and compute steps; they run one after the other, never concurrently.
+    def __init__(self, release: Callable[[], None]):
+        self.profile = cProfile.Profile()
+        self.started = time.perf_counter()
+        self._release = release
+        self._running = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            profiled = not self._closed
+            if profiled:
+                self._running += 1
+        if not profiled:
+            # A timed-out request's work can still reach the pool after close; run it unprofiled.
+            return func(*args, **kwargs)
+        try:
+            return self.profile.runcall(func, *args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+                done = self._closed and not self._running
+            if done:
+                self._release()
+
+    def close(self) -> None:
+        # The slot frees once no profiled call is still running in a worker thread.
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            done = not self._running
+        if done:
+            self._release()
+
+class RequestProfiler:
+    def __init__(self, directory: str, sample_rate: float = 0.0, keep: int = 200):
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.keep = keep
+        self.sampled = 0
+        self._lock = threading.Lock()
+        # cProfile on sys.monitoring (Python 3.12+) allows one active profiler per process.
+        self._active = threading.Lock()
+
+    def sample(self) -> Optional[ProfileSession]:
+        if not self.directory or self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return None
+        if not self._active.acquire(blocking=False):
+            return None
+        self.sampled += 1
+        return ProfileSession(self._active.release)
+
+    def save(self, session: ProfileSession, tag: ProfileTag) -> str:
+        elapsed_ms = int((time.perf_counter() - session.started) * 1000)
+        name = "_".join([str(int(time.time() * 1000)), str(elapsed_ms)] + [sanitize(part) for part in tag]) + ".prof"
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            session.profile.dump_stats(path)
+            self._rotate()
+        return path
+
+    def _rotate(self) -> None:
+        if self.keep <= 0:
+            return
+        names = self.profiles()
+        for name in names[:max(len(names) - self.keep, 0)]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def profiles(self, match: Optional[str] = None) -> List[str]:
+        # File names start with the millisecond timestamp, so name order is age order.
+        try:
+            names = sorted(name for name in os.listdir(self.directory) if name.endswith(".prof"))
+        except FileNotFoundError:
+            return []
+        if match:
+            names = [name for name in names if match.lower() in name.lower()]
+        return names
+
+    def clear(self) -> int:
+        with self._lock:
+            names = self.profiles()
+            for name in names:
+                os.remove(os.path.join(self.directory, name))
+        return len(names)
+
+    def summary(self, match: Optional[str] = None, limit: int = 15) -> str:
+        names = self.profiles(match)
+        if not names:
+            return "No profiles recorded."
+        runs = []
+        for name in names:
+            _, elapsed_ms, symbol, interval, period, signal_type = name[:-len(".prof")].split("_", 5)
+            runs.append((int(elapsed_ms), f"{symbol} {interval}/{period} {signal_type}"))
+        stats = pstats.Stats(*[os.path.join(self.directory, name) for name in names])
+        lines = [f"{len(names)} profiles, sample rate {self.sample_rate:.0%}", "Slowest requests:"]
+        lines.extend(f"{elapsed_ms:>7} ms  {tag}" for elapsed_ms, tag in sorted(runs, reverse=True)[:5])
+        lines.append("Top functions by cumulative time:")
+        lines.append(f"{'cum s':>8} {'own s':>8} {'calls':>8}  function")
+        top = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+        for (filename, line, function), (_, calls, own, cumulative, _) in top[:limit]:
+            location = f"{os.path.basename(filename)}:{line}" if line else filename
+            lines.append(f"{cumulative:>8.3f} {own:>8.3f} {calls:>8}  {function} ({location})")
+        return "\n".join(lines)
+
+profiler = RequestProfiler(profile_dir, profile_sample_rate, profile_keep)
@@ -0,0 +1,44 @@
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from functools import lru_cache
+from io import BytesIO
+from typing import Optional
+from core.cache import OHLCVCache
+from core.config import render_cache_mb
+from core.metrics import registry, render_seconds
+
+CARD_SIZE = (400, 200)
+NEVER = float('inf')
+
+card_images = OHLCVCache(max_bytes=render_cache_mb * 1024 * 1024)
+card_file_ids = OHLCVCache(max_bytes=render_cache_mb * 1024 * 1024 // 16)
+registry.register_stats("cache", card_images.stats, cache="card_image")
+registry.register_stats("cache", card_file_ids.stats, cache="card_file_id")
+
+@lru_cache(maxsize=1)
+def default_font():
+    from PIL import ImageFont
+    return ImageFont.load_default()
+
+def render_signal_card(text: str) -> bytes:
+    image = card_images.get(text)
+    if image is None:
+        from PIL import Image, ImageDraw
+        with render_seconds.time():
+            img = Image.new('RGB', CARD_SIZE, color=(0, 0, 0))
+            d = ImageDraw.Draw(img)
+            d.multiline_text((10, 10), text, fill=(255, 255, 255), font=default_font())
+            buf = BytesIO()
+            img.save(buf, format='PNG')
+            image = buf.getvalue()
+        card_images.put(text, image, NEVER)
+    return image
+
+def cached_file_id(text: str) -> Optional[str]:
+    return card_file_ids.get(text)
+
+def remember_file_id(text: str, message) -> None:
+    if message is not None and message.photo:
+        card_file_ids.put(text, message.photo[-1].file_id, NEVER)
+        card_images.invalidate(text)